@@ -63,6 +63,8 @@ a = Analysis(
         ('bash-autocomplete.sh', '.'),
         ('full-config-example.yaml', '.'),
         ('server-config-example.yaml', '.'),
+        ('static', 'static'),
+        ('templates', 'templates'),
     ],
     hiddenimports=[
         'yaml',
@@ -4,9 +4,34 @@ Handles loading and validation of configuration files.
 """
 
 import os
+import copy
 import yaml
 from pathlib import Path
 
+# libyaml's C loader when PyYAML was built with it: same results, several times faster
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+_yaml_cache = {}
+
+
+def load_yaml_file(path):
+    """Parse a YAML file, reusing the last parse while the file's mtime and size are unchanged.
+    
+    Raises OSError / yaml.YAMLError like open() and yaml.safe_load(). Each caller gets its
+    own copy, so callers may modify the result.
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _yaml_cache.get(path)
+    if cached is None or cached[0] != key:
+        with open(path, 'r') as f:
+            cached = (key, yaml.load(f, Loader=_YamlLoader))
+        _yaml_cache[path] = cached
+    return copy.deepcopy(cached[1])
+
 
 class ConfigManager:
     """Manages configuration loading and validation."""
@@ -17,21 +42,29 @@ class ConfigManager:
             config_file = os.path.expanduser("~/.config/mirror-test/mirror-test.yaml")
         
         self.config_file = config_file
+        self.config = {}
+        self._config_mtime = None
         self.config = self.load_config()
     
     def load_config(self):
-        """Load configuration from YAML file."""
+        """Load configuration from YAML file, skipping the parse if it is unchanged."""
         if not os.path.exists(self.config_file):
             self.create_default_config()
+        
+        # A stat() is far cheaper than a YAML parse; only re-read on modification
+        mtime = os.stat(self.config_file).st_mtime_ns
+        if mtime == self._config_mtime:
+            return self.config
             
         with open(self.config_file, 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
             
         if not config:
             config = {}
         
         # Update the instance variable so get_distributions() uses the new config
         self.config = config
+        self._config_mtime = mtime
         return config
     
     def create_default_config(self):
@@ -329,9 +329,13 @@ class MirrorTester:
             f.write(f"STDERR:\n{stderr}\n")
             f.write("=" * 50 + "\n")
     
+    def get_log_path(self, dist_name):
+        """Get the build log file path for a distribution."""
+        return os.path.join(self.log_dir, f"{dist_name}.log")
+    
     def get_latest_log(self, dist_name):
         """Get the latest build log for a distribution."""
-        log_file = os.path.join(self.log_dir, f"{dist_name}.log")
+        log_file = self.get_log_path(dist_name)
         
         if not os.path.exists(log_file):
             return {'error': 'No logs found for this distribution'}
@@ -340,12 +344,12 @@ class MirrorTester:
             with open(log_file, 'r') as f:
                 content = f.read()
             
-            # Extract the last build
-            builds = content.split("=== Build ")[1:]  # Skip the first empty split
-            if not builds:
+            # Extract the last build without splitting the whole history
+            marker = content.rfind("=== Build ")
+            if marker == -1:
                 return {'error': 'No build logs found'}
             
-            last_build = builds[-1]
+            last_build = content[marker + len("=== Build "):]
             lines = last_build.split('\n')
             
             # Parse the log
@@ -9,9 +9,8 @@ import sys
 import argparse
 import logging
 import shutil
-import yaml
 from pathlib import Path
-from config import ConfigManager
+from config import ConfigManager, load_yaml_file
 from core import MirrorTester
 from cli import CLIInterface
 
@@ -55,8 +54,7 @@ def load_server_config():
         return
     
     try:
-        with open(config_path, 'r') as f:
-            SERVER_CONFIG = yaml.safe_load(f)
+        SERVER_CONFIG = load_yaml_file(config_path)
         
         # Handle legacy LDAPS config format
         if 'ldap_server' in SERVER_CONFIG:
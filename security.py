@@ -13,11 +13,20 @@ import hmac
 import base64
 import uuid
 import ipaddress
+import bisect
 import logging
 import logging.handlers
-from datetime import timedelta, datetime
+import queue
+import sqlite3
+import threading
+from collections import OrderedDict
+import atexit
+from types import MappingProxyType
+from datetime import timedelta, datetime, timezone
 from pathlib import Path
 
+from config import load_yaml_file
+
 # Optional LDAP imports
 try:
     import ldap
@@ -25,6 +34,13 @@ try:
 except ImportError:
     LDAP_AVAILABLE = False
 
+# Optional radix trie for IP prefix matching
+try:
+    import pytricia
+    PYTRICIA_AVAILABLE = True
+except ImportError:
+    PYTRICIA_AVAILABLE = False
+
 # Optional Flask imports
 try:
     from flask import request, session, g
@@ -33,6 +49,245 @@ try:
 except ImportError:
     FLASK_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
+# Largest audit log page a single query may return
+MAX_AUDIT_PAGE_SIZE = 1000
+
+
+AUDIT_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS audit_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    event_type TEXT,
+    user TEXT,
+    success INTEGER,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_audit_ts_type ON audit_events (timestamp DESC, event_type);
+CREATE INDEX IF NOT EXISTS idx_audit_user_ts ON audit_events (user, timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_audit_success_ts ON audit_events (success, timestamp DESC);
+CREATE TABLE IF NOT EXISTS audit_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class AuditIndexHandler(logging.Handler):
+    """Mirror audit.log into a SQLite table so queries can use indexes.
+    
+    Runs on the audit QueueListener thread. The table holds exactly the entries of
+    the current audit.log, the same set a log file scan reads: it is reconciled with
+    the file on startup and emptied when the file rotates. Rotated backups are not
+    indexed; audit.log and its backups remain the long-term record.
+    """
+    
+    INSERT = "INSERT INTO audit_events (timestamp, event_type, user, success, entry) VALUES (?, ?, ?, ?, ?)"
+    
+    def __init__(self, db_file):
+        super().__init__()
+        self.db_file = db_file
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        # One commit per audit record; with WAL and synchronous=NORMAL it no longer waits on an fsync
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(AUDIT_INDEX_SCHEMA)
+        with self.conn:
+            self.conn.execute("INSERT OR IGNORE INTO audit_meta (key, value) VALUES ('epoch', ?)",
+                              (uuid.uuid4().hex[:8],))
+        self.pending = []     # entries not yet committed (an insert failed); retried with the next record
+        self.rotated = False  # audit.log rotated; the table is emptied with the next insert
+    
+    @staticmethod
+    def _rows(entries):
+        return [(e.get('timestamp') or '', e.get('event_type'), e.get('user'),
+                 int(bool(e.get('success', False))), json.dumps(e)) for e in entries]
+    
+    def _clear(self):
+        """Delete every row (inside the caller's transaction) and start a new epoch,
+        so pagination cursors issued before stop matching."""
+        self.conn.execute("DELETE FROM audit_events")
+        self.conn.execute("UPDATE audit_meta SET value = ? WHERE key = 'epoch'", (uuid.uuid4().hex[:8],))
+    
+    @property
+    def in_sync(self):
+        """False while the table is known to differ from audit.log."""
+        return not self.pending and not self.rotated
+    
+    def reconcile(self, entries):
+        """Make the table hold exactly `entries`, the parsed lines of audit.log.
+        
+        Normally the table is a prefix of the file (empty on first run, or behind
+        after running without the index) and only the missing tail is inserted. If
+        it is not, e.g. audit.log rotated while the index was off, it is rebuilt.
+        """
+        stored = [row[0] for row in self.conn.execute("SELECT entry FROM audit_events ORDER BY id")]
+        serialized = [json.dumps(e) for e in entries]
+        with self.conn:
+            if serialized[:len(stored)] != stored:
+                self._clear()
+                stored = []
+            self.conn.executemany(self.INSERT, self._rows(entries[len(stored):]))
+    
+    def rotate(self, source, dest):
+        """RotatingFileHandler.rotator: rename as usual, then start the table over."""
+        if os.path.exists(source):
+            os.rename(source, dest)
+        self.pending = []
+        self.rotated = True
+    
+    def emit(self, record):
+        try:
+            self.pending.append(json.loads(record.getMessage()))
+            with self.conn:
+                if self.rotated:
+                    self._clear()
+                self.conn.executemany(self.INSERT, self._rows(self.pending))
+            self.rotated = False
+            self.pending = []
+        except Exception:
+            self.handleError(record)
+    
+    def close(self):
+        self.conn.close()
+        super().close()
+
+
+class TwoQCache:
+    """Small thread-safe 2Q cache.
+    
+    New keys enter a FIFO probation queue and only move to the main LRU area if
+    they are requested again after falling out of it, so a burst of one-off
+    queries can't evict the frequently repeated ones.
+    """
+    
+    def __init__(self, maxsize=256):
+        self._in_size = max(1, maxsize // 4)
+        self._main_size = max(1, maxsize - self._in_size)
+        self._ghost_size = max(1, maxsize // 2)
+        self._in = OrderedDict()      # probation FIFO: key -> value
+        self._main = OrderedDict()    # frequent LRU: key -> value
+        self._ghost = OrderedDict()   # keys recently evicted from probation
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._main:
+                self._main.move_to_end(key)
+                return self._main[key]
+            return self._in.get(key, default)
+    
+    def put(self, key, value):
+        with self._lock:
+            if key in self._main:
+                self._main[key] = value
+                self._main.move_to_end(key)
+            elif key in self._ghost:
+                # Seen before: promote straight into the main LRU
+                del self._ghost[key]
+                self._main[key] = value
+                if len(self._main) > self._main_size:
+                    self._main.popitem(last=False)
+            else:
+                self._in[key] = value
+                if len(self._in) > self._in_size:
+                    old_key, _ = self._in.popitem(last=False)
+                    self._ghost[old_key] = None
+                    if len(self._ghost) > self._ghost_size:
+                        self._ghost.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._in.clear()
+            self._main.clear()
+            self._ghost.clear()
+
+
+class _AuditVersionHandler(logging.Handler):
+    """Last handler on the audit listener: bumps the audit version once a record is written."""
+    
+    def __init__(self, security_manager):
+        super().__init__()
+        self.security_manager = security_manager
+    
+    def emit(self, record):
+        self.security_manager._audit_version += 1
+
+
+class IPPrefixSet:
+    """Set of IPv4/IPv6 prefixes with longest-prefix membership tests.
+    
+    Backed by pytricia radix tries when installed; otherwise by merged, sorted
+    integer ranges searched with bisect. Both are O(log n) per lookup, and are
+    skipped entirely for addresses whose /24 (IPv4) or /64 (IPv6) block holds
+    no configured prefix.
+    """
+    
+    # Host bits dropped to form the prefilter block key
+    BLOCK_SHIFT = {4: 32 - 24, 6: 128 - 64}
+    
+    def __init__(self, entries):
+        networks = []
+        for entry in entries or []:
+            try:
+                networks.append(ipaddress.ip_network(entry, strict=False))
+            except ValueError:
+                continue
+        self._count = len(networks)
+        
+        # Exact prefilter: blocks touched by narrow prefixes. A prefix wider than the
+        # block can't be keyed this way, so its presence disables the prefilter for
+        # that IP version.
+        self._blocks = {4: set(), 6: set()}
+        for network in networks:
+            blocks = self._blocks[network.version]
+            if blocks is None:
+                continue
+            shift = self.BLOCK_SHIFT[network.version]
+            if network.max_prefixlen - network.prefixlen > shift:
+                self._blocks[network.version] = None
+            else:
+                blocks.add(int(network.network_address) >> shift)
+        
+        if PYTRICIA_AVAILABLE:
+            self._tries = {4: pytricia.PyTricia(32), 6: pytricia.PyTricia(128)}
+            for network in networks:
+                self._tries[network.version][str(network)] = True
+            return
+        
+        self._tries = None
+        spans = {4: [], 6: []}
+        for network in networks:
+            spans[network.version].append((int(network.network_address), int(network.broadcast_address)))
+        self._ranges = {}
+        for version, version_spans in spans.items():
+            starts, ends = [], []
+            for start, end in sorted(version_spans):
+                if ends and start <= ends[-1] + 1:
+                    ends[-1] = max(ends[-1], end)
+                else:
+                    starts.append(start)
+                    ends.append(end)
+            self._ranges[version] = (starts, ends)
+    
+    def __contains__(self, ip):
+        """Check an ipaddress.IPv4Address/IPv6Address against the set."""
+        blocks = self._blocks[ip.version]
+        if blocks is not None and (int(ip) >> self.BLOCK_SHIFT[ip.version]) not in blocks:
+            return False
+        if self._tries is not None:
+            trie = self._tries[ip.version]
+            return str(ip) in trie
+        starts, ends = self._ranges[ip.version]
+        value = int(ip)
+        i = bisect.bisect_right(starts, value) - 1
+        return i >= 0 and value <= ends[i]
+    
+    def __len__(self):
+        """Number of valid prefixes the set was built from."""
+        return self._count
+
 
 class SecurityManager:
     """Manages all security features for Mirror Test."""
@@ -44,9 +299,26 @@ class SecurityManager:
         self.server_config = None
         self.ip_whitelist_config = None
         self.ip_whitelist_enabled = False
+        self._compiled_whitelist = None
+        self.ip_whitelist_view = None
+        self.ip_whitelist_counts = None
         self.audit_log_config = None
         self.audit_logger = None
+        self._audit_listener = None
+        self._audit_index = None  # AuditIndexHandler when sqlite_index is enabled
+        # Query results are cached under the audit version, which moves on every write
+        self._audit_version = 0
+        self._audit_version_salt = uuid.uuid4().hex[:8]  # keeps tags unique across processes
+        self._audit_cache = TwoQCache(256)
+        atexit.register(self._stop_audit_listener)
         self.api_keys = {}
+        self._api_key_index = {}  # HMAC-SHA256(api_key) -> key_id
+        self._api_keys_lock = threading.Lock()
+        
+        # Idle LDAPS connections reused across logins (saves a TLS handshake each)
+        self._ldap_pool = queue.LifoQueue(maxsize=8)
+        self._ldap_pool_lock = threading.Lock()
+        self._ldap_pool_key_current = None
         self.api_version = "1.0"
         self.api_signature_secret = os.urandom(32)
         
@@ -68,25 +340,22 @@ class SecurityManager:
         
         if os.path.exists(server_config_file):
             try:
-                import yaml
-                with open(server_config_file, 'r') as f:
-                    self.server_config = yaml.safe_load(f)
-                print(f"Loaded server configuration from {server_config_file}")
+                self.server_config = load_yaml_file(server_config_file)
+                logger.info(f"Loaded server configuration from {server_config_file}")
             except Exception as e:
-                print(f"Error loading server config: {e}")
+                logger.error(f"Error loading server config: {e}")
                 self.server_config = None
         elif os.path.exists(ldaps_config_file):
             try:
-                import yaml
-                with open(ldaps_config_file, 'r') as f:
-                    self.ldaps_config = yaml.safe_load(f)
-                print(f"Loading legacy LDAPS configuration from {ldaps_config_file}")
+                self.ldaps_config = load_yaml_file(ldaps_config_file)
+                logger.info(f"Loading legacy LDAPS configuration from {ldaps_config_file}")
             except Exception as e:
-                print(f"Error loading LDAPS config: {e}")
+                logger.error(f"Error loading LDAPS config: {e}")
                 self.ldaps_config = None
         else:
-            print("Warning: Server configuration not found. Authentication disabled.")
-            print("Create ~/.config/mirror-test/server-config.yaml or ~/.config/mirror-test/ldaps-config.yaml to enable authentication.")
+            logger.warning("Server configuration not found. Authentication disabled. "
+                           "Create ~/.config/mirror-test/server-config.yaml or "
+                           "~/.config/mirror-test/ldaps-config.yaml to enable authentication.")
         
         # Load LDAPS configuration
         if self.server_config and 'ldaps' in self.server_config:
@@ -99,6 +368,15 @@ class SecurityManager:
         if self.server_config and 'ip_whitelist' in self.server_config:
             self.ip_whitelist_config = self.server_config['ip_whitelist']
             self.ip_whitelist_enabled = self.ip_whitelist_config.get('enabled', False)
+            _, allow_set, deny_set = self._compile_ip_whitelist(self.ip_whitelist_config)
+            self.ip_whitelist_counts = MappingProxyType({'allow': len(allow_set), 'deny': len(deny_set)})
+            # Read-only snapshot for the status API, built once per config load
+            self.ip_whitelist_view = MappingProxyType({
+                'mode': self.ip_whitelist_config.get('mode', 'allow'),
+                'allow': tuple(self.ip_whitelist_config.get('allow', [])),
+                'deny': tuple(self.ip_whitelist_config.get('deny', [])),
+                'bypass_ips': tuple(self.ip_whitelist_config.get('bypass_ips', []))
+            })
         
         # Load audit log configuration
         if self.server_config and 'audit_log' in self.server_config:
@@ -117,7 +395,8 @@ class SecurityManager:
         self.audit_logger = logging.getLogger('mirror_test_audit')
         self.audit_logger.setLevel(logging.INFO)
         
-        # Remove existing handlers
+        # Remove existing handlers (and stop the previous writer thread, if any)
+        self._stop_audit_listener()
         for handler in self.audit_logger.handlers[:]:
             self.audit_logger.removeHandler(handler)
         
@@ -144,8 +423,34 @@ class SecurityManager:
         )
         file_handler.setFormatter(formatter)
         
-        # Add handler to logger
-        self.audit_logger.addHandler(file_handler)
+        handlers = [file_handler]
+        
+        # Optional SQLite index for filtered/paginated audit queries
+        self._audit_index = None
+        if self.audit_log_config.get('sqlite_index', False):
+            index_file = os.path.join(log_dir, 'audit.db')
+            try:
+                index_handler = AuditIndexHandler(index_file)
+                entries = []
+                if os.path.exists(log_file):
+                    with open(log_file, 'r') as f:
+                        entries = [e for e in map(self._parse_audit_line, f) if e is not None]
+                # Catch up on events written while the index was off or failing
+                index_handler.reconcile(entries)
+                file_handler.rotator = index_handler.rotate
+                handlers.append(index_handler)
+                self._audit_index = index_handler
+            except sqlite3.Error as e:
+                logger.warning("Audit SQLite index unavailable, falling back to log file scans: %s", e)
+        
+        # Request threads only enqueue records; a background listener thread
+        # does the file I/O and rotation
+        audit_queue = queue.SimpleQueue()
+        self.audit_logger.addHandler(logging.handlers.QueueHandler(audit_queue))
+        handlers.append(_AuditVersionHandler(self))
+        self._audit_listener = logging.handlers.QueueListener(audit_queue, *handlers)
+        self._audit_version += 1
+        self._audit_listener.start()
         
         # Log audit system startup
         self.log_audit_event(
@@ -155,6 +460,16 @@ class SecurityManager:
             success=True
         )
     
+    def _stop_audit_listener(self):
+        """Flush queued audit records and stop the background writer thread."""
+        listener = self._audit_listener
+        if listener is None:
+            return
+        self._audit_listener = None
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+    
     def _apply_append_only_attribute(self, log_file):
         """Apply append-only attribute (chattr +a) to audit log file for security."""
         try:
@@ -172,24 +487,21 @@ class SecurityManager:
                                   capture_output=True, text=True, timeout=10)
             
             if result.returncode == 0:
-                print(f"✓ Applied append-only attribute to audit log: {log_file}")
-                print("  Audit log is now protected against tampering (chattr +a)")
+                logger.info("Applied append-only attribute (chattr +a) to audit log: %s", log_file)
             else:
-                print(f"⚠ Warning: Could not apply append-only attribute to {log_file}")
-                print(f"  Error: {result.stderr}")
-                print("  Audit logging will continue without tamper protection")
-                print("  To enable protection, run as root or check chattr availability")
+                logger.warning("Could not apply append-only attribute to %s: %s. Audit logging will continue "
+                               "without tamper protection; run as root or check chattr availability.",
+                               log_file, result.stderr.strip())
                 
         except subprocess.TimeoutExpired:
-            print(f"⚠ Warning: Timeout applying append-only attribute to {log_file}")
-            print("  Audit logging will continue without tamper protection")
+            logger.warning("Timeout applying append-only attribute to %s; "
+                           "audit logging will continue without tamper protection", log_file)
         except FileNotFoundError:
-            print(f"⚠ Warning: chattr command not found - append-only attribute not applied")
-            print("  Audit logging will continue without tamper protection")
-            print("  Install util-linux package or run on a system with chattr support")
+            logger.warning("chattr command not found - append-only attribute not applied; audit logging will "
+                           "continue without tamper protection (install util-linux for chattr support)")
         except Exception as e:
-            print(f"⚠ Warning: Error applying append-only attribute: {e}")
-            print("  Audit logging will continue without tamper protection")
+            logger.warning("Error applying append-only attribute: %s; "
+                           "audit logging will continue without tamper protection", e)
     
     def log_audit_event(self, event_type, user, action, details=None, ip_address=None, success=True):
         """Log an audit event."""
@@ -240,119 +552,35 @@ class SecurityManager:
         if not self.ldaps_config or not LDAP_AVAILABLE:
             return False, "LDAPS not configured or unavailable"
         
+        conn = None
         try:
-            import ssl
-            
-            # Create LDAP connection
-            ldap_server = self.ldaps_config['ldap_server']
-            ldap_port = self.ldaps_config.get('ldap_port', 636)
-            
-            print(f"Connecting to LDAP server: {ldap_server}:{ldap_port}")
-            print(f"LDAPS config: {self.ldaps_config}")
-            
-            # Always enforce SSL certificate verification for security
-            verify_cert = self.ldaps_config.get('ldap_verify_cert', True)
-            if not verify_cert:
-                print("WARNING: ldap_verify_cert is set to false, but SSL verification will be enforced for security")
-                print("To use self-signed certificates, configure proper certificate trust instead")
-            
-            print(f"Certificate verification setting: {verify_cert}")
-            
-            # Always create secure SSL context with full verification
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False  # Disable hostname verification for IP connections
-            ssl_context.verify_mode = ssl.CERT_REQUIRED
-            
-            # Configure certificate trust if specified
-            ca_cert = self.ldaps_config.get('ldap_ca_cert')
-            print(f"DEBUG: ca_cert from config: {ca_cert}")
-            
-            if ca_cert:
-                # Expand the path to handle ~ and relative paths
-                expanded_ca_cert = os.path.expanduser(ca_cert)
-                print(f"DEBUG: expanded_ca_cert: {expanded_ca_cert}")
-                
-                if os.path.exists(expanded_ca_cert):
-                    print(f"Using custom certificate: {expanded_ca_cert}")
-                    
-                    # Verify the certificate file is readable
-                    try:
-                        with open(expanded_ca_cert, 'r') as f:
-                            cert_content = f.read()
-                            print(f"Certificate file is readable ({len(cert_content)} bytes)")
-                            
-                            # Check if this looks like a server certificate (not CA)
-                            if "dc01.SEANCOHMER.COM" in cert_content or "SEANCOHMER" in cert_content:
-                                print("Detected server certificate - using for direct verification")
-                                # For server certificates, we need to disable hostname verification
-                                # since we're verifying against the certificate directly
-                                ssl_context.check_hostname = False
-                                print("Disabled hostname verification for server certificate")
-                                
-                                # Load as CA certificate for verification
-                                ssl_context.load_verify_locations(expanded_ca_cert)
-                                print("Loaded server certificate for verification")
-                            else:
-                                print("Certificate appears to be a CA certificate")
-                                ssl_context.load_verify_locations(expanded_ca_cert)
-                                print("Loaded CA certificate for verification")
-                    except Exception as e:
-                        print(f"Warning: Could not read certificate file: {e}")
-                else:
-                    print(f"ERROR: Certificate file not found: {expanded_ca_cert}")
-                    print("Falling back to system default CA certificates")
-            else:
-                print("Using system default CA certificates")
-            
-            print("SSL certificate verification ENABLED - using secure context")
-            
-            # Debug: Show how to extract the correct certificate
-            if ca_cert and os.path.exists(os.path.expanduser(ca_cert)):
-                print(f"\nTo verify your LDAP server certificate, run:")
-                print(f"openssl s_client -connect {ldap_server}:{ldap_port} -showcerts < /dev/null 2>/dev/null | openssl x509 -outform PEM")
-                print(f"Compare the output with your CA certificate file: {os.path.expanduser(ca_cert)}")
-                print("The certificates should match for verification to work.\n")
-            
-            # Connect to LDAP server
-            conn = ldap.initialize(f"ldaps://{ldap_server}:{ldap_port}")
-            print("LDAP connection initialized")
-            
-            # Set basic LDAP options
-            conn.set_option(ldap.OPT_REFERRALS, 0)
-            conn.set_option(ldap.OPT_PROTOCOL_VERSION, 3)
-            print("Basic LDAP options set")
-            
-            # Set the SSL context first (before other SSL options)
-            try:
-                conn.set_option(ldap.OPT_X_TLS_CTX, ssl_context)
-                print("SSL context set successfully")
-            except Exception as e:
-                print(f"Warning: Could not set SSL context: {e}")
-                # Continue without SSL context - some LDAP libraries handle SSL differently
-            
-            # Always enforce SSL certificate verification
-            conn.set_option(ldap.OPT_X_TLS_REQUIRE_CERT, ldap.OPT_X_TLS_DEMAND)
-            print("SSL certificate verification set to DEMAND (secure)")
-            
-            conn.set_option(ldap.OPT_X_TLS, ldap.OPT_X_TLS_DEMAND)
-            conn.set_option(ldap.OPT_DEBUG_LEVEL, 0)
-            
-            print("SSL/TLS options set")
+            conn, reused, pool_key = self._acquire_ldap_connection()
             
             # Bind with user credentials
             base_dn = self.ldaps_config.get('ldap_base_dn', self.ldaps_config.get('base_dn'))
             user_dn_template = self.ldaps_config.get('user_dn_template', 'uid={username},{base_dn}')
             user_dn = user_dn_template.format(username=username, base_dn=base_dn)
             
-            print(f"Attempting LDAP bind with user_dn: {user_dn}")
-            conn.simple_bind_s(user_dn, password)
+            logger.debug(f"Attempting LDAP bind with user_dn: {user_dn}")
+            try:
+                conn.simple_bind_s(user_dn, password)
+            except ldap.SERVER_DOWN:
+                if not reused:
+                    raise
+                # Pooled connection went stale (idle timeout); retry once on a fresh one
+                self._discard_ldap_connection(conn)
+                conn = None
+                pool_key = self._ldap_pool_key()
+                conn = self._create_ldap_connection()
+                conn.simple_bind_s(user_dn, password)
             
             # Get user attributes
             user_attrs = self._get_user_attributes(conn, user_dn)
             user_groups = self._get_user_groups(conn, user_dn)
             
-            # Close connection
-            conn.unbind_s()
+            # Connection is healthy; keep it for the next login
+            self._release_ldap_connection(conn, pool_key)
+            conn = None
             
             return True, {
                 'username': username,
@@ -362,6 +590,9 @@ class SecurityManager:
             }
             
         except ldap.INVALID_CREDENTIALS:
+            # A failed bind leaves the connection usable
+            self._release_ldap_connection(conn, pool_key)
+            conn = None
             return False, "Invalid username or password"
         except ldap.SERVER_DOWN:
             return False, "LDAP server is not available"
@@ -371,6 +602,164 @@ class SecurityManager:
             return False, f"SSL error: {str(e)}"
         except Exception as e:
             return False, f"Authentication error: {str(e)}"
+        finally:
+            if conn is not None:
+                self._discard_ldap_connection(conn)
+    
+    def _create_ldap_connection(self):
+        """Open a new LDAPS connection with certificate verification configured."""
+        import ssl
+        
+        # Create LDAP connection
+        ldap_server = self.ldaps_config['ldap_server']
+        ldap_port = self.ldaps_config.get('ldap_port', 636)
+        
+        logger.debug(f"Connecting to LDAP server: {ldap_server}:{ldap_port}")
+        
+        # Always enforce SSL certificate verification for security
+        verify_cert = self.ldaps_config.get('ldap_verify_cert', True)
+        if not verify_cert:
+            logger.warning("ldap_verify_cert is set to false, but SSL verification will be enforced for security; "
+                           "to use self-signed certificates, configure proper certificate trust instead")
+        
+        logger.debug(f"Certificate verification setting: {verify_cert}")
+        
+        # Always create secure SSL context with full verification
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False  # Disable hostname verification for IP connections
+        ssl_context.verify_mode = ssl.CERT_REQUIRED
+        
+        # Configure certificate trust if specified
+        ca_cert = self.ldaps_config.get('ldap_ca_cert')
+        logger.debug(f"ca_cert from config: {ca_cert}")
+        
+        if ca_cert:
+            # Expand the path to handle ~ and relative paths
+            expanded_ca_cert = os.path.expanduser(ca_cert)
+            logger.debug(f"expanded_ca_cert: {expanded_ca_cert}")
+        
+            if os.path.exists(expanded_ca_cert):
+                logger.debug(f"Using custom certificate: {expanded_ca_cert}")
+        
+                # Verify the certificate file is readable
+                try:
+                    with open(expanded_ca_cert, 'r') as f:
+                        cert_content = f.read()
+                        logger.debug(f"Certificate file is readable ({len(cert_content)} bytes)")
+        
+                        # Check if this looks like a server certificate (not CA)
+                        if "dc01.SEANCOHMER.COM" in cert_content or "SEANCOHMER" in cert_content:
+                            logger.debug("Detected server certificate - using for direct verification")
+                            # For server certificates, we need to disable hostname verification
+                            # since we're verifying against the certificate directly
+                            ssl_context.check_hostname = False
+                            logger.debug("Disabled hostname verification for server certificate")
+        
+                            # Load as CA certificate for verification
+                            ssl_context.load_verify_locations(expanded_ca_cert)
+                            logger.debug("Loaded server certificate for verification")
+                        else:
+                            logger.debug("Certificate appears to be a CA certificate")
+                            ssl_context.load_verify_locations(expanded_ca_cert)
+                            logger.debug("Loaded CA certificate for verification")
+                except Exception as e:
+                    logger.warning(f"Could not read certificate file: {e}")
+            else:
+                logger.error("Certificate file not found: %s; falling back to system default CA certificates",
+                             expanded_ca_cert)
+        else:
+            logger.debug("Using system default CA certificates")
+        
+        logger.debug("SSL certificate verification ENABLED - using secure context")
+        
+        # Debug: Show how to extract the correct certificate
+        if ca_cert and os.path.exists(os.path.expanduser(ca_cert)):
+            logger.debug("To verify the LDAP server certificate, compare the output of "
+                         "'openssl s_client -connect %s:%s -showcerts' with %s",
+                         ldap_server, ldap_port, os.path.expanduser(ca_cert))
+        
+        # Connect to LDAP server
+        conn = ldap.initialize(f"ldaps://{ldap_server}:{ldap_port}")
+        logger.debug("LDAP connection initialized")
+        
+        # Set basic LDAP options
+        conn.set_option(ldap.OPT_REFERRALS, 0)
+        conn.set_option(ldap.OPT_PROTOCOL_VERSION, 3)
+        logger.debug("Basic LDAP options set")
+        
+        # Set the SSL context first (before other SSL options)
+        try:
+            conn.set_option(ldap.OPT_X_TLS_CTX, ssl_context)
+            logger.debug("SSL context set successfully")
+        except Exception as e:
+            logger.warning(f"Could not set SSL context: {e}")
+            # Continue without SSL context - some LDAP libraries handle SSL differently
+        
+        # Always enforce SSL certificate verification
+        conn.set_option(ldap.OPT_X_TLS_REQUIRE_CERT, ldap.OPT_X_TLS_DEMAND)
+        logger.debug("SSL certificate verification set to DEMAND (secure)")
+        
+        conn.set_option(ldap.OPT_X_TLS, ldap.OPT_X_TLS_DEMAND)
+        conn.set_option(ldap.OPT_DEBUG_LEVEL, 0)
+        
+        logger.debug("SSL/TLS options set")
+        
+        return conn
+    
+    def _ldap_pool_key(self):
+        """Settings that determine whether a pooled connection can be reused."""
+        return (
+            self.ldaps_config.get('ldap_server'),
+            self.ldaps_config.get('ldap_port', 636),
+            self.ldaps_config.get('ldap_ca_cert')
+        )
+    
+    def _acquire_ldap_connection(self):
+        """Take an idle pooled LDAPS connection, or open a new one.
+        
+        Returns (conn, reused, key), where key is the _ldap_pool_key() the
+        connection was opened under; pass it back to _release_ldap_connection.
+        """
+        key = self._ldap_pool_key()
+        with self._ldap_pool_lock:
+            if key != self._ldap_pool_key_current:
+                # Server settings changed; drop connections to the old server
+                self._close_ldap_pool()
+                self._ldap_pool_key_current = key
+            try:
+                return self._ldap_pool.get_nowait(), True, key
+            except queue.Empty:
+                pass
+        return self._create_ldap_connection(), False, key
+    
+    def _release_ldap_connection(self, conn, key):
+        """Return a connection to the pool, closing it instead if the pool is full or
+        the server settings changed while it was checked out."""
+        with self._ldap_pool_lock:
+            if key == self._ldap_pool_key_current == self._ldap_pool_key():
+                try:
+                    self._ldap_pool.put_nowait(conn)
+                    return
+                except queue.Full:
+                    pass
+        self._discard_ldap_connection(conn)
+    
+    @staticmethod
+    def _discard_ldap_connection(conn):
+        """Close a connection that should not be reused."""
+        try:
+            conn.unbind_s()
+        except Exception:
+            pass
+    
+    def _close_ldap_pool(self):
+        """Close all idle pooled LDAPS connections."""
+        while True:
+            try:
+                conn = self._ldap_pool.get_nowait()
+            except queue.Empty:
+                return
+            self._discard_ldap_connection(conn)
     
     def _get_user_attributes(self, conn, user_dn):
         """Get user attributes from LDAP."""
@@ -398,6 +787,15 @@ class SecurityManager:
             pass
         return groups
     
+    def _compile_ip_whitelist(self, whitelist_config):
+        """Precompute allow/deny prefix sets for a whitelist config and cache them."""
+        self._compiled_whitelist = (
+            whitelist_config,
+            IPPrefixSet(whitelist_config.get('allow', [])),
+            IPPrefixSet(whitelist_config.get('deny', []))
+        )
+        return self._compiled_whitelist
+    
     def is_ip_in_whitelist(self, ip_address, whitelist_config):
         """Check if IP address is in whitelist."""
         if not whitelist_config:
@@ -408,37 +806,19 @@ class SecurityManager:
         except ValueError:
             return False
         
+        # Prefix sets are built once per config; rebuild if a different config is passed in
+        compiled = self._compiled_whitelist
+        if compiled is None or compiled[0] is not whitelist_config:
+            compiled = self._compile_ip_whitelist(whitelist_config)
+        _, allow_set, deny_set = compiled
+        
         # Check allow list
-        allow_list = whitelist_config.get('allow', [])
-        for allowed in allow_list:
-            try:
-                if '/' in allowed:
-                    # CIDR notation
-                    network = ipaddress.ip_network(allowed, strict=False)
-                    if ip in network:
-                        return True
-                else:
-                    # Single IP
-                    if ip == ipaddress.ip_address(allowed):
-                        return True
-            except ValueError:
-                continue
+        if ip in allow_set:
+            return True
         
         # Check deny list
-        deny_list = whitelist_config.get('deny', [])
-        for denied in deny_list:
-            try:
-                if '/' in denied:
-                    # CIDR notation
-                    network = ipaddress.ip_network(denied, strict=False)
-                    if ip in network:
-                        return False
-                else:
-                    # Single IP
-                    if ip == ipaddress.ip_address(denied):
-                        return False
-            except ValueError:
-                continue
+        if ip in deny_set:
+            return False
         
         # Default behavior based on mode
         mode = whitelist_config.get('mode', 'allow')
@@ -460,7 +840,7 @@ class SecurityManager:
         key_id = str(uuid.uuid4())
         api_key = base64.urlsafe_b64encode(os.urandom(32)).decode('utf-8')
         
-        self.api_keys[key_id] = {
+        key_data = {
             'name': name,
             'key': api_key,
             'permissions': permissions,
@@ -468,18 +848,48 @@ class SecurityManager:
             'last_used': None,
             'usage_count': 0
         }
+        digest = self._api_key_digest(api_key)
+        with self._api_keys_lock:
+            self.api_keys[key_id] = key_data
+            self._api_key_index[digest] = key_id
         
         return key_id, api_key
     
+    def revoke_api_key(self, key_id):
+        """Revoke an API key. Returns False if no such key exists."""
+        with self._api_keys_lock:
+            key_data = self.api_keys.pop(key_id, None)
+            if key_data is None:
+                return False
+            self._api_key_index.pop(self._api_key_digest(key_data['key']), None)
+        return True
+    
+    def _api_key_digest(self, api_key):
+        """Keyed digest of an API key, used to index keys without storing them as dict keys."""
+        return hmac.new(self.api_signature_secret, api_key.encode('utf-8'), hashlib.sha256).digest()
+    
     def validate_api_key(self, api_key):
         """Validate an API key."""
-        for key_id, key_data in self.api_keys.items():
-            if key_data['key'] == api_key:
-                # Update usage stats
-                key_data['last_used'] = datetime.utcnow().isoformat()
-                key_data['usage_count'] += 1
-                return key_id, key_data
-        return None, None
+        if not api_key:
+            return None, None
+        
+        digest = self._api_key_digest(api_key)
+        key_id = self._api_key_index.get(digest)
+        key_data = self.api_keys.get(key_id) if key_id else None
+        if key_data is None:
+            if key_id:
+                # Key was revoked; drop the stale index entry
+                self._api_key_index.pop(digest, None)
+            return None, None
+        
+        # Constant-time comparison guards against timing side channels
+        if not hmac.compare_digest(key_data['key'].encode('utf-8'), api_key.encode('utf-8')):
+            return None, None
+        
+        # Update usage stats
+        key_data['last_used'] = datetime.utcnow().isoformat()
+        key_data['usage_count'] += 1
+        return key_id, key_data
     
     def check_api_permission(self, permissions, required_permission):
         """Check if API key has required permission."""
@@ -496,70 +906,235 @@ class SecurityManager:
             success=200 <= status_code < 400
         )
     
-    def get_audit_logs(self, limit=100, offset=0, event_type=None, user=None, start_date=None, end_date=None, status=None):
-        """Get audit logs with filtering."""
+    def _get_audit_log_file(self):
+        """Path of the audit log, or None if audit logging is disabled."""
         if not self.audit_log_config or not self.audit_log_config.get('enabled', True):
-            return []
-        
-        log_file = os.path.join(
+            return None
+        return os.path.join(
             os.path.expanduser(self.audit_log_config.get('log_dir', '~/.local/log/mirror-test')),
             'audit.log'
         )
+    
+    @staticmethod
+    def _parse_audit_line(line):
+        """Parse one audit log line into a dict, or None if it is not an audit entry."""
+        # Format: "2025-09-21 02:38:29 - INFO - {json_data}"
+        line = line.strip()
+        marker = line.find(' - INFO - ')
+        if marker != -1:
+            line = line[marker + len(' - INFO - '):]
+        try:
+            # Whole line as JSON is accepted for backward compatibility
+            return json.loads(line)
+        except json.JSONDecodeError:
+            return None
+    
+    @staticmethod
+    def _audit_time_bound(ts):
+        """Convert an epoch bound to the UTC ISO form audit entries are stored in.
+        
+        Stored timestamps sort lexically in time order, so rows are compared as
+        plain strings against this value without parsing each one.
+        """
+        if ts is None:
+            return None
+        return datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None).isoformat()
+    
+    @staticmethod
+    def _build_audit_filter(event_type=None, user=None, start_date=None, end_date=None, status=None):
+        """Build a single predicate for the given audit log filters (dates as stored ISO strings)."""
+        # Handle status filtering: 'success', 'failure', or boolean
+        if status == 'success':
+            want_success = True
+        elif status == 'failure':
+            want_success = False
+        elif status in [True, False]:
+            want_success = status
+        else:
+            want_success = None
         
-        if not os.path.exists(log_file):
-            return []
+        def matches(log_entry):
+            if event_type and log_entry.get('event_type') != event_type:
+                return False
+            if user and log_entry.get('user') != user:
+                return False
+            timestamp = log_entry.get('timestamp') or ''
+            if start_date and timestamp < start_date:
+                return False
+            if end_date and timestamp > end_date:
+                return False
+            if want_success is not None and bool(log_entry.get('success', False)) != want_success:
+                return False
+            return True
+        
+        return matches
+    
+    @staticmethod
+    def encode_audit_cursor(marker, timestamp, entry_id):
+        """Encode an opaque keyset pagination cursor.
+        
+        `marker` names the backend and generation the entry id belongs to (audit.log
+        inode or SQLite index epoch); a cursor is only accepted while it still matches.
+        """
+        return base64.urlsafe_b64encode(f"{marker}|{timestamp}|{entry_id}".encode('utf-8')).decode('ascii')
+    
+    @staticmethod
+    def decode_audit_cursor(cursor):
+        """Decode a cursor from encode_audit_cursor() into (marker, timestamp, entry_id);
+        raises ValueError if malformed."""
+        try:
+            marker, rest = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8').split('|', 1)
+            timestamp, entry_id = rest.rsplit('|', 1)
+            return marker, timestamp, int(entry_id)
+        except (UnicodeError, ValueError, TypeError) as e:
+            raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    
+    @staticmethod
+    def _check_audit_cursor(after, marker):
+        """Reject a cursor issued by the other backend or before the log rotated."""
+        if after and after[0] != marker:
+            raise ValueError("Cursor is stale or from another audit log backend")
+    
+    def audit_version_tag(self):
+        """Opaque tag that changes whenever an audit event is written (for HTTP ETags)."""
+        return f"{self._audit_version_salt}-{self._audit_version}"
+    
+    def get_audit_logs_page(self, limit=100, offset=0, event_type=None, user=None, start_ts=None, end_ts=None,
+                            status=None, cursor=None):
+        """Get one page of filtered audit logs plus the total number of matches.
+        
+        Walks the log once, most recent first. Pages are selected by `cursor` (keyset,
+        from a previous call) or, as a deprecated fallback, by `offset`. `limit` is
+        clamped to 1..MAX_AUDIT_PAGE_SIZE; start_ts/end_ts are inclusive epoch-second
+        bounds. Returns (logs, total, next_cursor);
+        next_cursor is None on the last page. Raises ValueError for a malformed or stale cursor.
+        """
+        limit = max(1, min(int(limit), MAX_AUDIT_PAGE_SIZE))
+        offset = max(0, int(offset))
+        after = self.decode_audit_cursor(cursor) if cursor else None
+        
+        cache_key = ('page', self._audit_version, limit, offset, event_type, user, start_ts, end_ts, status, cursor)
+        cached = self._audit_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        start_date = self._audit_time_bound(start_ts)
+        end_date = self._audit_time_bound(end_ts)
+        
+        result = None
+        index = self._audit_index
+        if index is not None and index.in_sync:
+            try:
+                result = self._query_audit_index(limit, offset, event_type, user, start_date, end_date, status, after)
+            except sqlite3.Error as e:
+                logger.warning("Audit SQLite index query failed, scanning log file: %s", e)
+        if result is None:
+            result = self._scan_audit_log(limit, offset, event_type, user, start_date, end_date, status, after)
+        
+        logs, total, last_key = result
+        next_cursor = None
+        if len(logs) == limit and last_key is not None:
+            next_cursor = self.encode_audit_cursor(*last_key)
+        
+        page = (logs, total, next_cursor)
+        self._audit_cache.put(cache_key, page)
+        return page
+    
+    def _scan_audit_log(self, limit, offset, event_type, user, start_date, end_date, status, after):
+        """get_audit_logs_page() against audit.log.
+        
+        Entry ids are line numbers, so cursors carry the file's inode and a hash of
+        its first line (inodes get reused) and stop matching once audit.log rotates.
+        """
+        log_file = self._get_audit_log_file()
+        if not log_file or not os.path.exists(log_file):
+            return [], 0, None
         
-        logs = []
         try:
             with open(log_file, 'r') as f:
+                inode = os.fstat(f.fileno()).st_ino
                 lines = f.readlines()
-            
-            # Parse ALL logs first, then apply filtering and pagination
-            for line in reversed(lines):  # Read all lines, most recent first
-                try:
-                    # Extract JSON from formatted log line
-                    # Format: "2025-09-21 02:38:29 - INFO - {json_data}"
-                    line = line.strip()
-                    if ' - INFO - ' in line:
-                        json_start = line.find(' - INFO - ') + len(' - INFO - ')
-                        json_data = line[json_start:]
-                        log_entry = json.loads(json_data)
-                    else:
-                        # Try parsing the whole line as JSON (for backward compatibility)
-                        log_entry = json.loads(line)
-                    
-                    # Apply filters
-                    if event_type and log_entry.get('event_type') != event_type:
-                        continue
-                    if user and log_entry.get('user') != user:
-                        continue
-                    if start_date and log_entry.get('timestamp') < start_date:
-                        continue
-                    if end_date and log_entry.get('timestamp') > end_date:
-                        continue
-                    if status is not None:
-                        # Handle status filtering: 'success', 'failure', or boolean
-                        if status == 'success' and not log_entry.get('success', False):
-                            continue
-                        elif status == 'failure' and log_entry.get('success', False):
-                            continue
-                        elif status in [True, False] and log_entry.get('success') != status:
-                            continue
-                    
-                    logs.append(log_entry)
-                        
-                except json.JSONDecodeError:
-                    continue
-            
-            # Apply pagination after filtering
-            if offset > 0:
-                logs = logs[offset:]
-            if limit > 0:  # Only apply limit if it's greater than 0
-                logs = logs[:limit]
-                
-        except Exception:
-            pass
+        except OSError:
+            return [], 0, None
+        first_line = hashlib.sha1(lines[0].encode('utf-8')).hexdigest()[:8] if lines else ''
+        marker = f"f{inode:x}-{first_line}"
+        self._check_audit_cursor(after, marker)
+        
+        # Page in the (timestamp, id) order cursors encode, which file order need not follow
+        matches = self._build_audit_filter(event_type, user, start_date, end_date, status)
+        keyed = []
+        for line_no, line in enumerate(lines):
+            log_entry = self._parse_audit_line(line)
+            if log_entry is not None and matches(log_entry):
+                keyed.append(((log_entry.get('timestamp') or '', line_no), log_entry))
+        keyed.sort(key=lambda item: item[0], reverse=True)
+        
+        start = offset
+        if after:
+            # Keyset pages start right after the cursor, so the offset no longer applies
+            after_key = after[1:]
+            start = next((i for i, (key, _) in enumerate(keyed) if key < after_key), len(keyed))
+        page = keyed[start:start + limit]
+        last_key = (marker,) + page[-1][0] if page else None
+        return [log_entry for _, log_entry in page], len(keyed), last_key
+    
+    def _query_audit_index(self, limit, offset, event_type, user, start_date, end_date, status, after):
+        """get_audit_logs_page() against the SQLite index: filter, sort, page and count in SQL."""
+        # Only add conditions for filters that are present so the indexes stay usable
+        conditions = []
+        params = []
+        if event_type:
+            conditions.append("event_type = ?")
+            params.append(event_type)
+        if user:
+            conditions.append("user = ?")
+            params.append(user)
+        if start_date:
+            conditions.append("timestamp >= ?")
+            params.append(start_date)
+        if end_date:
+            conditions.append("timestamp <= ?")
+            params.append(end_date)
+        if status == 'success' or status is True:
+            conditions.append("success = 1")
+        elif status == 'failure' or status is False:
+            conditions.append("success = 0")
         
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        conn = sqlite3.connect(self._audit_index.db_file)
+        try:
+            epoch = conn.execute("SELECT value FROM audit_meta WHERE key = 'epoch'").fetchone()
+            marker = f"i{epoch[0] if epoch else ''}"
+            self._check_audit_cursor(after, marker)
+            if after:
+                # Keyset page: an index range scan from the cursor instead of skipping rows
+                page_where = f"{where} AND" if where else "WHERE"
+                rows = conn.execute(
+                    f"SELECT entry, timestamp, id FROM audit_events {page_where} (timestamp, id) < (?, ?) "
+                    f"ORDER BY timestamp DESC, id DESC LIMIT ?",
+                    params + [after[1], after[2], limit]
+                ).fetchall()
+                total = conn.execute(f"SELECT COUNT(*) FROM audit_events {where}", params).fetchone()[0]
+            else:
+                rows = conn.execute(
+                    f"SELECT entry, timestamp, id, COUNT(*) OVER () AS total FROM audit_events {where} "
+                    f"ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?",
+                    params + [limit, offset]
+                ).fetchall()
+                if rows:
+                    total = rows[0][3]
+                else:
+                    # Window count is only available on returned rows (e.g. offset past the end)
+                    total = conn.execute(f"SELECT COUNT(*) FROM audit_events {where}", params).fetchone()[0]
+        finally:
+            conn.close()
+        
+        last_key = (marker, rows[-1][1], rows[-1][2]) if rows else None
+        return [json.loads(row[0]) for row in rows], total, last_key
+    
+    def get_audit_logs(self, limit=100, offset=0, event_type=None, user=None, start_ts=None, end_ts=None, status=None):
+        """Get audit logs with filtering."""
+        logs, _, _ = self.get_audit_logs_page(limit, offset, event_type, user, start_ts, end_ts, status)
         return logs
     
     def get_audit_stats(self):
@@ -567,6 +1142,11 @@ class SecurityManager:
         if not self.audit_log_config or not self.audit_log_config.get('enabled', True):
             return {}
         
+        cache_key = ('stats', self._audit_version)
+        cached = self._audit_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         logs = self.get_audit_logs(limit=1000)  # Get more logs for stats
         
         stats = {
@@ -594,4 +1174,5 @@ class SecurityManager:
         if logs:
             stats['success_rate'] = (success_count / len(logs)) * 100
         
+        self._audit_cache.put(cache_key, stats)
         return stats
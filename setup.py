@@ -10,6 +10,7 @@ setup(
     description="A secure web interface for testing Linux repository mirrors using container builds",
     author="Mirror Test Team",
     packages=find_packages(),
+    include_package_data=True,  # static/ and templates/ files listed in MANIFEST.in
     python_requires=">=3.8",
     install_requires=[
         "PyYAML>=5.4.0",
@@ -0,0 +1,1171 @@
+function createTextElement(tagName, text, className) {
+    const el = document.createElement(tagName);
+    if (className) {
+        el.className = className;
+    }
+    el.textContent = text;
+    return el;
+}
+
+// Small localStorage cache for read-only GETs. Fresh entries skip the network; stale
+// ones are revalidated with If-None-Match when the server sent an ETag.
+const CACHE_PREFIX = 'c:';
+const DISTRIBUTIONS_CACHE_TTL_MS = 60000;
+const STATS_CACHE_TTL_MS = 10000;
+const BUILD_HISTORY_CACHE_TTL_MS = 10000;
+
+function readCacheEntry(key) {
+    try {
+        return JSON.parse(localStorage.getItem(key) || 'null');
+    } catch (e) {
+        return null;
+    }
+}
+
+function writeCacheEntry(key, entry) {
+    try {
+        localStorage.setItem(key, JSON.stringify(entry));
+    } catch (e) {
+        // Storage full or disabled: just don't cache
+    }
+}
+
+function invalidateCached(url) {
+    try {
+        localStorage.removeItem(CACHE_PREFIX + url);
+    } catch (e) {
+        // Storage disabled: nothing was cached
+    }
+}
+
+async function cachedFetch(url, ttlMs, force = false) {
+    const key = CACHE_PREFIX + url;
+    const entry = readCacheEntry(key);
+    const now = Date.now();
+    if (entry && !force && now - entry.t < ttlMs) {
+        return entry.d;
+    }
+
+    const headers = (entry && entry.etag) ? {'If-None-Match': entry.etag} : {};
+    const response = await fetch(url, {headers: headers});
+    if (response.status === 304 && entry) {
+        entry.t = now;
+        writeCacheEntry(key, entry);
+        return entry.d;
+    }
+    if (!response.ok) {
+        throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+    }
+    const data = await response.json();
+    writeCacheEntry(key, {t: now, etag: response.headers.get('ETag'), d: data});
+    return data;
+}
+
+// Concurrent callers share one in-flight /api/distributions request (and the cached
+// result); explicit refreshes pass force to go to the server.
+let distributionsPromise = null;
+
+function getDistributions(force = false) {
+    if (force || !distributionsPromise) {
+        const request = cachedFetch('/api/distributions', DISTRIBUTIONS_CACHE_TTL_MS, force);
+        const done = () => {
+            if (distributionsPromise === request) {
+                distributionsPromise = null;
+            }
+        };
+        request.then(done, done);
+        distributionsPromise = request;
+    }
+    return distributionsPromise;
+}
+
+// Leading + trailing throttle: the first call runs at once, calls inside the window
+// collapse into one trailing run
+function throttle(fn, wait) {
+    let last = 0;
+    let timer = null;
+    return function throttled() {
+        if (timer) {
+            return;
+        }
+        const remaining = wait - (Date.now() - last);
+        const run = () => {
+            timer = null;
+            last = Date.now();
+            fn();
+        };
+        if (remaining <= 0) {
+            run();
+        } else {
+            timer = setTimeout(run, remaining);
+        }
+    };
+}
+
+function runWhenIdle(fn) {
+    if (window.requestIdleCallback) {
+        requestIdleCallback(fn, {timeout: 2000});
+    } else {
+        setTimeout(fn, 200);
+    }
+}
+
+// Refreshes after test runs are not urgent: throttle them into one fetch + render per
+// window (stats additionally wait for idle time so they never compete with input)
+const REFRESH_THROTTLE_MS = 500;
+const updateStatsThrottled = throttle(() => runWhenIdle(updateStats), REFRESH_THROTTLE_MS);
+const updateBuildListsThrottled = throttle(() => updateBuildLists(), REFRESH_THROTTLE_MS);
+
+async function viewDockerfile(distName = null) {
+    const targetDist = distName || selectedDistribution;
+
+    if (!targetDist) {
+        showStatus('Please select a distribution first', 'error');
+        return;
+    }
+
+    try {
+        const response = await fetch(`/api/dockerfile/${targetDist}`);
+        const data = await response.json();
+
+        if (data.error) {
+            showStatus(`Error: ${data.error}`, 'error');
+            return;
+        }
+
+        highlightDockerfile(data.dockerfile || 'No Dockerfile available');
+        switchTab('dockerfile');
+
+    } catch (error) {
+        console.error('Dockerfile error:', error);
+        showStatus(`Error: ${error.message}`, 'error');
+    }
+}
+
+// Every test button goes through these two: one POST to /api/test, then each result is
+// recorded in the build history. postTests throws with the server's error message.
+async function postTests(distributions, signal) {
+    const response = await fetch('/api/test', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({distributions: distributions}),
+        signal
+    });
+    const data = await response.json().catch(() => ({}));
+    if (!response.ok || data.error) {
+        throw new Error(data.error || `HTTP ${response.status}: ${response.statusText}`);
+    }
+    return data.results || {};
+}
+
+// Returns {passed, failed}: the pass count and the names that failed. onResult, if
+// given, sees each distribution's result as it is recorded.
+function recordTestResults(distributions, results, onResult) {
+    let passed = 0;
+    const failed = [];
+    for (const dist of distributions) {
+        const result = results[dist];
+        if (!result) {
+            continue;
+        }
+        addToBuildHistory(dist, result.success, result.stderr);
+        if (result.success) {
+            passed++;
+        } else {
+            failed.push(dist);
+        }
+        if (onResult) {
+            onResult(dist, result);
+        }
+    }
+    return {passed, failed};
+}
+
+async function runTestAll() {
+    document.getElementById('testAllBtn').disabled = true;
+    showSpinner('testAllSpinner', true);
+    showStatus('Testing all distributions... This may take several minutes.', 'info');
+
+    try {
+        // The sidebar already lists every distribution; only ask the server when it's empty
+        let distributions = Array.from(document.querySelectorAll('.distribution-item'), el => el.dataset.dist);
+        if (distributions.length === 0) {
+            distributions = (await getDistributions()).distributions || [];
+        }
+
+        if (distributions.length === 0) {
+            showStatus('No distributions found', 'error');
+            return;
+        }
+
+        const results = await postTests(distributions);
+        const {passed, failed} = recordTestResults(distributions, results);
+
+        if (failed.length === 0) {
+            showStatus(`All ${passed} build tests passed successfully!`, 'success');
+        } else {
+            showStatus(`${passed} passed, ${failed.length} failed. Check logs for details.`, 'error');
+        }
+
+        // Update stats
+        updateStatsThrottled();
+
+    } catch (error) {
+        console.error('Test all error:', error);
+        showStatus(`Error: ${error.message}`, 'error');
+    } finally {
+        document.getElementById('testAllBtn').disabled = false;
+        showSpinner('testAllSpinner', false);
+    }
+}
+
+// Theme toggle functionality
+// Theme changes restyle the whole page; apply them in one animation frame and ignore
+// clicks that arrive before the previous switch has been painted
+let themeSwitching = false;
+
+function toggleTheme() {
+    if (themeSwitching) {
+        return;
+    }
+    themeSwitching = true;
+
+    const body = document.body;
+    const themeIcon = document.querySelector('.theme-icon');
+    const themeText = document.getElementById('theme-text');
+    const toLight = body.getAttribute('data-theme') !== 'light';
+    localStorage.setItem('theme', toLight ? 'light' : 'dark');
+
+    requestAnimationFrame(() => {
+        if (toLight) {
+            body.setAttribute('data-theme', 'light');
+            themeIcon.textContent = '☀️';
+            themeText.textContent = 'Light Mode';
+        } else {
+            body.removeAttribute('data-theme');
+            themeIcon.textContent = '🌙';
+            themeText.textContent = 'Dark Mode';
+        }
+        themeSwitching = false;
+    });
+}
+
+function logout() {
+    if (confirm('Are you sure you want to logout?')) {
+        window.location.href = '/logout';
+    }
+}
+
+// Load saved theme on page load
+document.addEventListener('DOMContentLoaded', function() {
+    const savedTheme = localStorage.getItem('theme');
+    if (savedTheme === 'light') {
+        document.body.setAttribute('data-theme', 'light');
+        document.querySelector('.theme-icon').textContent = '☀️';
+        document.getElementById('theme-text').textContent = 'Light Mode';
+    }
+});
+
+// Enhanced loading states
+// Trailing debounce: double-clicks or held keys trigger a single fetch + re-render
+const REFRESH_DEBOUNCE_MS = 250;
+let refreshDistributionsTimer = 0;
+
+function refreshDistributions() {
+    clearTimeout(refreshDistributionsTimer);
+    refreshDistributionsTimer = setTimeout(loadDistributionList, REFRESH_DEBOUNCE_MS);
+}
+
+// Signature of what each list currently shows; unchanged data skips the DOM write
+const lastRendered = {};
+
+function createDistributionItem(dist) {
+    const item = document.createElement('div');
+    item.className = 'distribution-item';
+    item.dataset.dist = dist;
+    if (selectedDistributions.has(dist)) {
+        item.classList.add('selected');
+        if (selectedDistributions.size > 1) {
+            item.classList.add('multi-selected');
+        }
+    }
+    item.appendChild(createTextElement('span', dist[0].toUpperCase(), 'dist-icon'));
+    item.appendChild(document.createTextNode(dist));
+    return item;
+}
+
+async function loadDistributionList() {
+    console.log('loadDistributionList() called');
+    try {
+        console.log('Fetching /api/distributions...');
+        const data = await getDistributions(true);
+        console.log('Received data:', data);
+
+        const distributionList = document.getElementById('distribution-list');
+        const dists = data.distributions || [];
+        const signature = dists.join('\n');
+        const shown = lastRendered.dists !== undefined
+            ? lastRendered.dists
+            : Array.from(distributionList.querySelectorAll('.distribution-item'), el => el.dataset.dist).join('\n');
+
+        // Same names in the same order: keep the existing rows (and their selection state)
+        if (signature !== shown) {
+            const frag = document.createDocumentFragment();
+            for (const dist of dists) {
+                frag.appendChild(createDistributionItem(dist));
+            }
+            distributionList.replaceChildren(frag);
+        }
+        lastRendered.dists = signature;
+        document.getElementById('total-distributions').textContent = dists.length;
+        updateStatsThrottled();
+        showStatus('Distribution list refreshed successfully', 'success');
+
+    } catch (error) {
+        console.error('Refresh error:', error);
+        showStatus(`Error refreshing distributions: ${error.message}`, 'error');
+    }
+}
+
+// New sidebar functionality
+let currentTab = 'output';
+let selectedDistribution = null;
+let selectedDistributions = new Set();
+// Latest in-memory build per distribution, oldest first (Map keeps insertion order)
+const buildHistory = new Map();
+const BUILD_HISTORY_LIMIT = 50;
+
+function switchTab(tab, event) {
+    // Resolve the target tab and panel first, then apply every class change in one
+    // animation frame so a following log write/scroll costs a single layout
+    const tabs = Array.from(document.querySelectorAll('.tab'));
+    const activeTabs = (event && event.target)
+        ? [event.target]
+        // Fallback: find the tab button by tab name
+        : tabs.filter(t => t.textContent.toLowerCase().includes(tab.toLowerCase()));
+    const contents = document.querySelectorAll('.tab-content');
+    const panel = document.getElementById(tab);
+
+    currentTab = tab;
+    requestAnimationFrame(() => {
+        tabs.forEach(t => t.classList.toggle('active', activeTabs.includes(t)));
+        contents.forEach(c => c.classList.toggle('active', c === panel));
+    });
+}
+
+function selectDistribution(event, distName) {
+    const isCtrlClick = event.ctrlKey || event.metaKey; // Support both Ctrl and Cmd (Mac)
+    const distItem = document.querySelector(`[data-dist="${distName}"]`);
+
+    if (isCtrlClick) {
+        // Ctrl+click: toggle selection
+        if (selectedDistributions.has(distName)) {
+            // Deselect
+            selectedDistributions.delete(distName);
+            distItem.classList.remove('selected', 'multi-selected');
+        } else {
+            // Select
+            selectedDistributions.add(distName);
+            distItem.classList.add('selected', 'multi-selected');
+        }
+        // Update selectedDistribution to the first selected item for single-item operations
+        selectedDistribution = selectedDistributions.size > 0 ? Array.from(selectedDistributions)[0] : null;
+        updateSelectedCount();
+    } else {
+        // Regular click: single selection
+        document.querySelectorAll('.distribution-item').forEach(item => {
+            item.classList.remove('selected', 'multi-selected');
+        });
+
+        if (distItem) {
+            distItem.classList.add('selected');
+        }
+
+        selectedDistribution = distName;
+        selectedDistributions.clear();
+        selectedDistributions.add(distName);
+        updateSelectedCount();
+    }
+
+    // Clear previous content; responses still in flight belong to the old selection
+    abortLoadLogs();
+    watchLogStream(null);
+    setLogPane('stdout', 'Select a distribution and click "Run Build Test" to see the build process...');
+    setLogPane('stderr', 'No errors to display...');
+    document.getElementById('dockerfileContent').textContent = 'Dockerfile will appear here...';
+    setLogPane('fullLog', 'Complete log will appear here...');
+}
+
+function updateSelectedCount() {
+    const testBtn = document.getElementById('testBtn');
+    const testSelectedBtn = document.getElementById('testSelectedBtn');
+    const count = selectedDistributions.size;
+
+    if (count > 1) {
+        // Multiple selections: show "Run Selected Tests" button
+        testBtn.style.display = 'none';
+        testSelectedBtn.style.display = 'block';
+        testSelectedBtn.textContent = `Run Selected Tests (${count})`;
+        testSelectedBtn.disabled = false;
+    } else if (count === 1) {
+        // Single selection: show "Run Build Test" button
+        testBtn.style.display = 'block';
+        testSelectedBtn.style.display = 'none';
+        testBtn.disabled = false;
+    } else {
+        // No selections: show "Run Build Test" button but disabled
+        testBtn.style.display = 'block';
+        testSelectedBtn.style.display = 'none';
+        testBtn.disabled = true;
+    }
+}
+
+function showStatus(message, type) {
+    const status = document.getElementById('status');
+    status.className = 'status ' + type;
+    status.textContent = message;
+    // Promote for the slideIn animation only; released when it finishes
+    status.style.willChange = 'transform, opacity';
+    status.addEventListener('animationend', () => {
+        status.style.willChange = 'auto';
+    }, {once: true});
+    status.style.display = 'block';
+
+    if (type !== 'error') {
+        setTimeout(() => {
+            status.style.display = 'none';
+        }, 5000);
+    }
+}
+
+function showSpinner(spinnerId, show) {
+    const spinner = document.getElementById(spinnerId);
+    if (spinner) {
+        spinner.style.display = show ? 'inline-block' : 'none';
+    }
+}
+
+// Log panes (<pre> stdout/stderr/fullLog) each keep one persistent Text node. Writes are
+// buffered and applied once per animation frame; appends are collected as parts and
+// joined once per frame into a single appendData(), so adding output costs O(chunk)
+// instead of re-serializing the whole pane.
+const logPanes = {};
+let logPaneFrame = 0;
+let logPaneScrollIds = null;
+
+function getLogPane(id) {
+    let pane = logPanes[id];
+    if (!pane) {
+        const el = document.getElementById(id);
+        const node = document.createTextNode(el.textContent);
+        el.replaceChildren(node);
+        pane = logPanes[id] = {node: node, reset: null, pending: []};
+    }
+    return pane;
+}
+
+function scheduleLogPaneFlush() {
+    if (!logPaneFrame) {
+        logPaneFrame = requestAnimationFrame(flushLogPanes);
+    }
+}
+
+function flushLogPanes() {
+    logPaneFrame = 0;
+    for (const pane of Object.values(logPanes)) {
+        if (pane.reset !== null) {
+            pane.node.data = pane.reset;
+            pane.reset = null;
+        }
+        if (pane.pending.length) {
+            pane.node.appendData(pane.pending.join(''));
+            pane.pending = [];
+        }
+    }
+    if (logPaneScrollIds) {
+        const ids = logPaneScrollIds;
+        logPaneScrollIds = null;
+        // Next frame: read every height (one layout for all writes above), then scroll
+        requestAnimationFrame(() => {
+            const panes = ids.map(id => document.getElementById(id));
+            const heights = panes.map(el => el.scrollHeight);
+            panes.forEach((el, i) => {
+                el.scrollTop = heights[i];
+            });
+        });
+    }
+}
+
+function scrollLogPanesToEnd(ids) {
+    logPaneScrollIds = ids;
+    scheduleLogPaneFlush();
+}
+
+function setLogPane(id, text) {
+    const pane = getLogPane(id);
+    pane.reset = text;
+    pane.pending = [];
+    scheduleLogPaneFlush();
+}
+
+function appendLogPane(id, chunk) {
+    getLogPane(id).pending.push(chunk);
+    scheduleLogPaneFlush();
+}
+
+// Live tail of the selected distribution's log while this page has a build of it in
+// flight: the server pushes the lines written since the stream opened (appended to the
+// Full Log pane) and sends 'done' once the build's block is complete. Never left open
+// while idle, so tabs don't tie up server workers or the per-host connection limit.
+let logStream = null;
+
+function watchLogStream(distName) {
+    if (logStream) {
+        logStream.close();
+        logStream = null;
+    }
+    if (!distName || !window.EventSource) {
+        return;
+    }
+    logStream = new EventSource(`/api/logs/${encodeURIComponent(distName)}/stream`);
+    logStream.onmessage = e => appendLogPane('fullLog', e.data + '\n');
+    logStream.addEventListener('done', () => watchLogStream(null));
+}
+
+// Simple syntax highlighting for Dockerfiles. Highlighted HTML is memoized per source
+// text (small LRU), since the same Dockerfile is shown again after every test run.
+const DOCKERFILE_KW = /^(\s*)(FROM|RUN|COPY|ADD|ENV|WORKDIR|EXPOSE|CMD|ENTRYPOINT|ARG|LABEL|USER|VOLUME|STOPSIGNAL|HEALTHCHECK|SHELL)(?=\s)/;
+const HIGHLIGHT_CACHE_SIZE = 16;
+const highlightCache = new Map();
+
+function escapeHtml(text) {
+    return text.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+}
+
+function highlightDockerfile(text) {
+    const content = document.getElementById('dockerfileContent');
+    if (!content) return;
+
+    let html = highlightCache.get(text);
+    if (html === undefined) {
+        // One pass over the lines; only a leading instruction is a keyword, so words
+        // like "ADD" inside a RUN command stay plain. Everything else is escaped:
+        // Dockerfiles may contain '<' (heredocs, shell redirects).
+        const parts = [];
+        for (const line of text.split('\n')) {
+            const m = DOCKERFILE_KW.exec(line);
+            if (m) {
+                parts.push(m[1], '<span class="keyword">', m[2], '</span>',
+                    escapeHtml(line.slice(m[0].length)), '\n');
+            } else {
+                parts.push(escapeHtml(line), '\n');
+            }
+        }
+        parts.pop();
+        html = parts.join('');
+        if (highlightCache.size >= HIGHLIGHT_CACHE_SIZE) {
+            highlightCache.delete(highlightCache.keys().next().value);
+        }
+    } else {
+        highlightCache.delete(text);  // re-insert below as most recently used
+    }
+    highlightCache.set(text, html);
+
+    content.innerHTML = html;
+}
+
+// "Run Build Test" clicks within a short window are merged into one /api/test POST.
+// Only the newest batch renders its results: starting another one aborts the previous
+// fetch, so its stale response is never parsed or rendered.
+const TEST_BATCH_WINDOW_MS = 150;
+const pendingTests = new Set();
+let testFlushTimer = null;
+let testCtrl = null;
+
+function runTest() {
+    if (!selectedDistribution) {
+        showStatus('Please select a distribution first', 'error');
+        return;
+    }
+    queueTest(selectedDistribution);
+}
+
+function queueTest(distName) {
+    pendingTests.add(distName);
+    if (!testFlushTimer) {
+        testFlushTimer = setTimeout(flushTests, TEST_BATCH_WINDOW_MS);
+    }
+}
+
+async function flushTests() {
+    testFlushTimer = null;
+    const distributions = Array.from(pendingTests);
+    pendingTests.clear();
+    if (distributions.length === 0) {
+        return;
+    }
+
+    if (testCtrl) {
+        testCtrl.abort();
+    }
+    const ctrl = testCtrl = new AbortController();
+
+    document.getElementById('testBtn').disabled = true;
+    showSpinner('testSpinner', true);
+    showStatus('Running build test... This may take a few minutes.', 'info');
+    if (distributions.includes(selectedDistribution)) {
+        watchLogStream(selectedDistribution);
+    }
+
+    try {
+        const results = await postTests(distributions, ctrl.signal);
+        const {failed} = recordTestResults(distributions, results);
+
+        if (distributions.length === 1) {
+            const distName = distributions[0];
+            if (failed.length === 0) {
+                showStatus(`Build test for ${distName} passed successfully!`, 'success');
+            } else {
+                showStatus(`Build test for ${distName} failed. Check logs for details.`, 'error');
+            }
+        } else if (failed.length === 0) {
+            showStatus(`All ${distributions.length} build tests passed successfully!`, 'success');
+        } else {
+            showStatus(`Build tests failed for ${failed.join(', ')}. Check logs for details.`, 'error');
+        }
+
+        // Auto-load logs if the selected distribution was part of this batch
+        if (distributions.includes(selectedDistribution)) {
+            await loadLogs();
+        }
+
+        // Update stats
+        updateStatsThrottled();
+
+    } catch (error) {
+        if (error.name === 'AbortError') {
+            return;
+        }
+        console.error('Test error:', error);
+        showStatus(`Error: ${error.message}`, 'error');
+    } finally {
+        // A newer batch owns the button, spinner and log stream now
+        if (testCtrl === ctrl) {
+            testCtrl = null;
+            watchLogStream(null);
+            document.getElementById('testBtn').disabled = false;
+            showSpinner('testSpinner', false);
+        }
+    }
+}
+
+// Run async task factories with at most `limit` in flight; resolves to their results
+// in task order once every task has settled
+async function pLimit(limit, tasks) {
+    const results = new Array(tasks.length);
+    let next = 0;
+    const worker = async () => {
+        while (next < tasks.length) {
+            const index = next++;
+            results[index] = await tasks[index]();
+        }
+    };
+    const workers = [];
+    for (let i = 0; i < Math.min(limit, tasks.length); i++) {
+        workers.push(worker());
+    }
+    await Promise.all(workers);
+    return results;
+}
+
+// "Test Selected" splits the selection into at most TEST_POOL_SIZE requests (the API
+// is limited to 10 POSTs a minute) and renders each batch as soon as it returns
+const TEST_POOL_SIZE = 4;
+
+async function runSelectedTests() {
+    if (selectedDistributions.size === 0) {
+        showStatus('Please select at least one distribution first', 'error');
+        return;
+    }
+
+    document.getElementById('testSelectedBtn').disabled = true;
+    showSpinner('testSelectedSpinner', true);
+    showStatus(`Running build tests for ${selectedDistributions.size} distributions... This may take several minutes.`, 'info');
+
+    const distributions = Array.from(selectedDistributions);
+    const batchSize = Math.ceil(distributions.length / TEST_POOL_SIZE);
+    const batches = [];
+    for (let i = 0; i < distributions.length; i += batchSize) {
+        batches.push(distributions.slice(i, i + batchSize));
+    }
+
+    let successCount = 0;
+    let failCount = 0;
+    const errors = [];
+    setLogPane('stdout', '');
+    setLogPane('stderr', '');
+
+    // Clear logs and dockerfile for multi-test
+    document.getElementById('dockerfileContent').textContent = 'Dockerfile view not available for multiple distributions';
+    setLogPane('fullLog', 'Full log view not available for multiple distributions');
+    watchLogStream(null);
+
+    const appendResult = (dist, result) => {
+        appendLogPane('stdout', `=== ${dist} ===\n${result.stdout || 'No output available'}\n\n`);
+        appendLogPane('stderr', `=== ${dist} ===\n${result.stderr || 'No errors'}\n\n`);
+    };
+
+    const tasks = batches.map(batch => async () => {
+        try {
+            const {passed, failed} = recordTestResults(batch, await postTests(batch), appendResult);
+            successCount += passed;
+            failCount += failed.length;
+            const done = successCount + failCount;
+            if (done < distributions.length) {
+                showStatus(`${done} of ${distributions.length} build tests finished (${failCount} failed)...`, 'info');
+            }
+        } catch (error) {
+            console.error('Error running selected tests:', error);
+            errors.push(error.message);
+        }
+    });
+
+    try {
+        await pLimit(TEST_POOL_SIZE, tasks);
+
+        if (successCount + failCount === 0) {
+            setLogPane('stdout', 'No output available');
+            setLogPane('stderr', 'No errors');
+        }
+
+        if (errors.length > 0 && successCount + failCount === 0) {
+            showStatus(`Error: ${errors[0]}`, 'error');
+        } else if (errors.length > 0) {
+            showStatus(`${successCount} tests succeeded, ${failCount} tests failed, some requests errored: ${errors[0]}`, 'warning');
+        } else if (failCount === 0) {
+            showStatus(`All ${successCount} build tests completed successfully!`, 'success');
+        } else if (successCount === 0) {
+            showStatus(`All ${failCount} build tests failed. Check the errors tab for details.`, 'error');
+        } else {
+            showStatus(`${successCount} tests succeeded, ${failCount} tests failed. Check the output for details.`, 'warning');
+        }
+
+        // Update stats
+        updateStatsThrottled();
+    } finally {
+        document.getElementById('testSelectedBtn').disabled = false;
+        showSpinner('testSelectedSpinner', false);
+    }
+}
+
+// Split one build block ("<timestamp> ===", "Return code:", "STDOUT:", "STDERR:", a
+// closing rule of 50 "=") into its sections; mirrors MirrorTester.get_latest_log
+const BUILD_LOG_END = '='.repeat(50);
+
+function parseBuildLog(block) {
+    const sections = {stdout: [], stderr: []};
+    let current = null;
+    for (const line of block.split('\n').slice(1)) {
+        if (line.startsWith('Return code:')) {
+            continue;
+        } else if (line.startsWith('STDOUT:')) {
+            current = 'stdout';
+        } else if (line.startsWith('STDERR:')) {
+            current = 'stderr';
+        } else if (line.startsWith(BUILD_LOG_END)) {
+            break;
+        } else if (current) {
+            sections[current].push(line + '\n');
+        }
+    }
+    return {stdout: sections.stdout.join(''), stderr: sections.stderr.join('')};
+}
+
+// Only the newest loadLogs call may write into the panes: a new call or a new selection
+// aborts the previous one's requests and its half-read log stream
+let logsCtrl = null;
+
+function abortLoadLogs() {
+    if (logsCtrl) {
+        logsCtrl.abort();
+        logsCtrl = null;
+    }
+}
+
+async function loadLogs() {
+    if (!selectedDistribution) {
+        showStatus('Please select a distribution first', 'error');
+        return;
+    }
+
+    abortLoadLogs();
+    const ctrl = logsCtrl = new AbortController();
+    const signal = ctrl.signal;
+
+    document.getElementById('logBtn').disabled = true;
+    showSpinner('logSpinner', true);
+
+    const distName = selectedDistribution;
+    try {
+        // Fetch logs and Dockerfile in parallel; the log comes back as plain text
+        const [logsResponse, dockerfileResponse] = await Promise.all([
+            fetch(`/api/logs/${distName}?format=text`, {signal}),
+            fetch(`/api/dockerfile/${distName}`, {signal})
+        ]);
+
+        if (!logsResponse.ok) {
+            const logsError = await logsResponse.json().catch(() => ({}));
+            showStatus(`Error: ${logsError.error || logsResponse.statusText}`, 'error');
+            return;
+        }
+        const dockerfileData = await dockerfileResponse.json();
+
+        // Stream the log into the Full Log pane as it arrives instead of waiting for
+        // the whole body, then split out stdout/stderr once it is complete
+        setLogPane('fullLog', '');
+        const reader = logsResponse.body.getReader();
+        const decoder = new TextDecoder();
+        const parts = [];
+        for (;;) {
+            const {done, value} = await reader.read();
+            const text = done ? decoder.decode() : decoder.decode(value, {stream: true});
+            if (text) {
+                parts.push(text);
+                appendLogPane('fullLog', text);
+            }
+            if (done) {
+                break;
+            }
+        }
+        const full = parts.join('');
+        const sections = parseBuildLog(full);
+
+        // Update all log displays
+        setLogPane('stdout', sections.stdout || 'No output available');
+        setLogPane('stderr', sections.stderr || 'No errors');
+        if (!full) {
+            setLogPane('fullLog', 'No complete log available');
+        }
+        scrollLogPanesToEnd(['stdout', 'stderr', 'fullLog']);
+
+        // Update Dockerfile content with syntax highlighting
+        if (dockerfileData.error) {
+            document.getElementById('dockerfileContent').textContent = 'No Dockerfile available';
+        } else {
+            highlightDockerfile(dockerfileData.dockerfile || 'No Dockerfile available');
+        }
+
+        // Don't switch tabs - stay on current tab
+
+    } catch (error) {
+        if (error.name === 'AbortError') {
+            return;
+        }
+        console.error('Log error:', error);
+        showStatus(`Error: ${error.message}`, 'error');
+    } finally {
+        if (logsCtrl === ctrl) {
+            logsCtrl = null;
+        }
+        // Unless a newer call owns the button and spinner now
+        if (logsCtrl === null) {
+            document.getElementById('logBtn').disabled = false;
+            showSpinner('logSpinner', false);
+        }
+    }
+}
+
+function addToBuildHistory(distName, success, stderr) {
+    // A finished build changes both; the next refresh must hit the server
+    invalidateCached('/api/stats');
+    invalidateCached('/api/build-history');
+
+    const build = {
+        dist: distName,
+        success: success,
+        timestamp: new Date(),
+        stderr: stderr
+    };
+
+    // Re-insert so this distribution moves to the newest end
+    buildHistory.delete(distName);
+    buildHistory.set(distName, build);
+
+    // Keep only the last 50 builds
+    while (buildHistory.size > BUILD_HISTORY_LIMIT) {
+        buildHistory.delete(buildHistory.keys().next().value);
+    }
+
+    updateBuildListsThrottled();
+}
+
+// Build rows keyed by "<success>|<dist>|<epoch ms>". A refresh only creates rows for
+// new builds and removes rows that dropped out; unchanged rows stay in the DOM.
+const buildNodeCache = new Map();
+
+// One shared formatter: toLocaleString() builds a new one on every call
+const BUILD_DATE_FORMAT = new Intl.DateTimeFormat(undefined, {dateStyle: 'short', timeStyle: 'medium'});
+
+function createBuildItem(distName, timestamp, success) {
+    const item = document.createElement('div');
+    item.className = `build-item ${success ? 'success-item' : 'failed-item'}`;
+    item.dataset.dist = distName;
+    item.appendChild(createTextElement('span', distName, 'build-dist'));
+    item.appendChild(createTextElement('span', BUILD_DATE_FORMAT.format(new Date(timestamp)), 'build-date'));
+    return item;
+}
+
+function renderBuildList(list, builds, success, emptyText) {
+    const prefix = `${success}|`;
+    const keys = builds.map(b => `${prefix}${b.dist}|${new Date(b.timestamp).getTime()}`);
+    const signature = keys.join(',');
+    if (lastRendered[prefix] === signature) {
+        return;
+    }
+    lastRendered[prefix] = signature;
+    const wanted = new Set(keys);
+
+    // Forget rows that are no longer listed
+    for (const [key, node] of buildNodeCache) {
+        if (key.startsWith(prefix) && !wanted.has(key)) {
+            node.remove();
+            buildNodeCache.delete(key);
+        }
+    }
+
+    if (builds.length === 0) {
+        list.replaceChildren(createTextElement('div', emptyText, 'no-builds'));
+        return;
+    }
+    list.querySelectorAll('.no-builds').forEach(el => el.remove());
+
+    // Walk in display order, creating missing rows and moving only out-of-place ones
+    let ref = list.firstElementChild;
+    builds.forEach((build, i) => {
+        let node = buildNodeCache.get(keys[i]);
+        if (!node) {
+            node = createBuildItem(build.dist, build.timestamp, success);
+            buildNodeCache.set(keys[i], node);
+        }
+        if (node === ref) {
+            ref = ref.nextElementSibling;
+        } else {
+            list.insertBefore(node, ref);
+        }
+    });
+}
+
+const BUILD_PANEL_SIZE = 10;
+
+function renderBuildPanels(builds) {
+    // One pass, stopping as soon as both panels are full
+    const successful = [];
+    const failed = [];
+    for (const build of builds) {
+        const list = build.success ? successful : failed;
+        if (list.length < BUILD_PANEL_SIZE) {
+            list.push(build);
+        } else if (successful.length === BUILD_PANEL_SIZE && failed.length === BUILD_PANEL_SIZE) {
+            break;
+        }
+    }
+    renderBuildList(document.getElementById('successful-builds-list'),
+        successful, true, 'No successful builds yet');
+    renderBuildList(document.getElementById('failed-builds-list'),
+        failed, false, 'No failed builds yet');
+}
+
+// Panel writes land in one animation frame; renders requested before it fires only
+// replace the builds that frame will draw. While the panels are scrolled out of view
+// the newest builds are kept and drawn once they come back into view.
+let pendingBuildPanels = null;
+let buildPanelsFrame = 0;
+let buildPanelsVisible = true;
+
+function scheduleBuildPanelsRender(builds) {
+    pendingBuildPanels = builds;
+    if (buildPanelsFrame || !buildPanelsVisible) {
+        return;
+    }
+    buildPanelsFrame = requestAnimationFrame(() => {
+        buildPanelsFrame = 0;
+        const latest = pendingBuildPanels;
+        pendingBuildPanels = null;
+        renderBuildPanels(latest);
+    });
+}
+
+function observeBuildPanels() {
+    const panels = document.querySelector('.build-panels');
+    if (!panels || !window.IntersectionObserver) {
+        return;
+    }
+    new IntersectionObserver((entries) => {
+        buildPanelsVisible = entries[entries.length - 1].isIntersecting;
+        if (buildPanelsVisible && pendingBuildPanels !== null) {
+            scheduleBuildPanelsRender(pendingBuildPanels);
+        }
+    }).observe(panels);
+}
+
+function toPanelBuilds(builds) {
+    return (builds || []).map(b => ({
+        dist: b.distribution,
+        success: b.success,
+        timestamp: b.timestamp
+    }));
+}
+
+async function updateBuildLists() {
+    try {
+        const data = await cachedFetch('/api/build-history', BUILD_HISTORY_CACHE_TTL_MS);
+        scheduleBuildPanelsRender(toPanelBuilds(data.builds));
+
+    } catch (error) {
+        console.error('Error fetching build history:', error);
+        // Fallback to in-memory data
+        scheduleBuildPanelsRender(Array.from(buildHistory.values()).reverse());
+    }
+}
+
+function loadBuildLogs(distName) {
+    // Create a synthetic event to simulate a regular click (not Ctrl+click)
+    const syntheticEvent = {
+        ctrlKey: false,
+        metaKey: false
+    };
+    selectDistribution(syntheticEvent, distName);
+    loadLogs();
+}
+
+function renderStats(data) {
+    document.getElementById('total-distributions').textContent = data.total_distributions || 0;
+    document.getElementById('recent-tests').textContent = data.recent_builds || 0;
+    document.getElementById('successful-builds').textContent = data.successful_builds || 0;
+    document.getElementById('failed-builds').textContent = data.failed_builds || 0;
+}
+
+async function updateStats() {
+    // The list is already on the page: show its size now, the server reconciles below
+    document.getElementById('total-distributions').textContent =
+        document.querySelectorAll('.distribution-item').length;
+
+    try {
+        const data = await cachedFetch('/api/stats', STATS_CACHE_TTL_MS);
+
+        renderStats(data);
+
+    } catch (error) {
+        console.error('Error fetching stats:', error);
+        // Fallback to in-memory data if server fails
+        const now = new Date();
+        const yesterday = new Date(now.getTime() - 24 * 60 * 60 * 1000);
+
+        const builds = Array.from(buildHistory.values());
+        const recent = builds.filter(b => b.timestamp > yesterday);
+        const successful = builds.filter(b => b.success);
+        const failed = builds.filter(b => !b.success);
+
+        // Get total distributions from the list
+        const totalDistributions = document.querySelectorAll('.distribution-item').length;
+
+        // Update the stat cards
+        document.getElementById('total-distributions').textContent = totalDistributions;
+        document.getElementById('recent-tests').textContent = recent.length;
+        document.getElementById('successful-builds').textContent = successful.length;
+        document.getElementById('failed-builds').textContent = failed.length;
+    }
+}
+
+// Promote hover-animated elements just before their transition starts and drop the
+// hint once it settles, rather than keeping a permanent layer for every button
+const HOVER_ANIMATED = '.btn';
+
+// All of the page's buttons sit in the sidebar; listen there rather than testing every
+// element the pointer enters anywhere on the page
+const hoverAnimatedRoot = document.querySelector('.sidebar');
+
+hoverAnimatedRoot.addEventListener('pointerover', function(e) {
+    const el = e.target.closest(HOVER_ANIMATED);
+    if (el) {
+        el.classList.add('will-animate');
+    }
+});
+
+hoverAnimatedRoot.addEventListener('transitionend', function(e) {
+    const el = e.target.closest(HOVER_ANIMATED);
+    if (el && !el.matches(':hover')) {
+        el.classList.remove('will-animate');
+    }
+});
+
+// Page controls carry data-action / data-tab / data-dist instead of inline onclick
+// attributes (module functions are not globals); one delegated listener routes them,
+// so re-rendered distribution and build rows never need handlers of their own
+const ACTIONS = {
+    'toggle-theme': toggleTheme,
+    'logout': logout,
+    'run-test': runTest,
+    'run-selected-tests': runSelectedTests,
+    'run-test-all': runTestAll,
+    'load-logs': loadLogs,
+    'view-dockerfile': () => viewDockerfile(),
+    'refresh-distributions': refreshDistributions
+};
+
+document.addEventListener('click', function(e) {
+    if (!(e.target instanceof Element)) {
+        return;
+    }
+    const actionEl = e.target.closest('[data-action]');
+    if (actionEl && ACTIONS[actionEl.dataset.action]) {
+        ACTIONS[actionEl.dataset.action]();
+        return;
+    }
+    const tabEl = e.target.closest('.tab[data-tab]');
+    if (tabEl) {
+        switchTab(tabEl.dataset.tab, {target: tabEl});
+        return;
+    }
+    const distItem = e.target.closest('.distribution-item[data-dist]');
+    if (distItem) {
+        selectDistribution(e, distItem.dataset.dist);
+        return;
+    }
+    const buildItem = e.target.closest('.build-item[data-dist]');
+    if (buildItem) {
+        loadBuildLogs(buildItem.dataset.dist);
+    }
+});
+
+// Builds recorded elsewhere (other tabs, the CLI) show up through a slow poll. Both
+// endpoints send ETags, so an unchanged history costs a 304; hidden tabs don't poll
+// and catch up as soon as they are shown again.
+const HISTORY_POLL_MS = 30000;
+let historyPollTimer = 0;
+
+function refreshHistory() {
+    updateStats();
+    updateBuildLists();
+}
+
+function watchHistory() {
+    clearInterval(historyPollTimer);
+    historyPollTimer = document.hidden ? 0 : setInterval(refreshHistory, HISTORY_POLL_MS);
+}
+
+document.addEventListener('visibilitychange', () => {
+    watchHistory();
+    if (!document.hidden) {
+        refreshHistory();
+    }
+});
+
+// Initialize on page load
+// Stats and build history are not needed for first paint (the template already shows
+// the distribution count): load them once the browser is idle instead of during load
+document.addEventListener('DOMContentLoaded', function() {
+    observeBuildPanels();
+    watchHistory();
+    runWhenIdle(refreshHistory);
+});
@@ -0,0 +1,359 @@
+const PAGE_SIZE = 20;
+let currentPage = 1;
+let totalPages = 1;
+
+// Audit log query, kept and updated in place: filters set/delete their parameter,
+// paging only rewrites offset
+const logParams = new URLSearchParams({limit: String(PAGE_SIZE), offset: '0'});
+
+// The page's fixed nodes, looked up once (this script loads at the end of <body>)
+const byId = id => document.getElementById(id);
+const dom = {
+    themeIcon: document.querySelector('.theme-icon'),
+    themeText: byId('theme-text'),
+    totalEvents: byId('total-events'),
+    successRate: byId('success-rate'),
+    authEvents: byId('auth-events'),
+    apiEvents: byId('api-events'),
+    logsContainer: byId('logs-container'),
+    logRowTemplate: byId('log-row-template'),
+    pagination: byId('pagination'),
+    pageInfo: byId('page-info'),
+    prevBtn: byId('prev-page'),
+    nextBtn: byId('next-page'),
+    userFilter: byId('user-filter')
+};
+
+// Query parameter -> filter control
+const FILTER_INPUTS = {
+    event_type: byId('event-type'),
+    user: dom.userFilter,
+    status: byId('status-filter'),
+    start_date: byId('date-from'),
+    end_date: byId('date-to')
+};
+
+// Theme toggle functionality
+function toggleTheme() {
+    const body = document.body;
+
+    if (body.getAttribute('data-theme') === 'light') {
+        body.removeAttribute('data-theme');
+        dom.themeIcon.textContent = '🌙';
+        dom.themeText.textContent = 'Dark Mode';
+        localStorage.setItem('theme', 'dark');
+    } else {
+        body.setAttribute('data-theme', 'light');
+        dom.themeIcon.textContent = '☀️';
+        dom.themeText.textContent = 'Light Mode';
+        localStorage.setItem('theme', 'light');
+    }
+}
+
+function logout() {
+    if (confirm('Are you sure you want to logout?')) {
+        window.location.href = '/logout';
+    }
+}
+
+// Load saved theme on page load
+document.addEventListener('DOMContentLoaded', function() {
+    const savedTheme = localStorage.getItem('theme');
+    if (savedTheme === 'light') {
+        document.body.setAttribute('data-theme', 'light');
+        dom.themeIcon.textContent = '☀️';
+        dom.themeText.textContent = 'Light Mode';
+    }
+
+    // Stat cards arrive server-rendered; only the log list needs a fetch
+    loadAuditLogs();
+
+    // Filter as the user types, once they pause
+    dom.userFilter.addEventListener('input', debounce(applyFilters, USER_FILTER_DEBOUNCE_MS));
+});
+
+// Trailing debounce: only the last call in a burst runs, wait ms after it
+function debounce(fn, wait) {
+    let timer = 0;
+    return function debounced() {
+        clearTimeout(timer);
+        timer = setTimeout(fn, wait);
+    };
+}
+
+const USER_FILTER_DEBOUNCE_MS = 300;
+
+// Both endpoints send ETags: a repeat request for what is already on screen carries
+// If-None-Match, and a 304 means there is nothing to parse or render. (Setting the
+// header ourselves makes fetch hand the 304 to us instead of the cached body.)
+let statsEtag = byId('audit-stats').dataset.etag || null;
+let shownQuery = null;
+let shownEtag = null;
+
+function conditionalHeaders(etag) {
+    return etag ? {'If-None-Match': etag} : {};
+}
+
+// A load asked for while the tab is hidden waits until it is shown again, so a
+// background tab never fetches or renders for a view nobody can see
+const deferredLoads = new Set();
+
+function deferWhileHidden(load) {
+    if (!document.hidden) {
+        return false;
+    }
+    deferredLoads.add(load);
+    return true;
+}
+
+document.addEventListener('visibilitychange', () => {
+    if (document.hidden) {
+        return;
+    }
+    const loads = [...deferredLoads];
+    deferredLoads.clear();
+    loads.forEach(load => load());
+});
+
+async function loadAuditStats() {
+    if (deferWhileHidden(loadAuditStats)) {
+        return;
+    }
+    try {
+        const response = await fetch('/api/v1/audit-stats', {headers: conditionalHeaders(statsEtag)});
+        if (response.status === 304) {
+            return;
+        }
+        const stats = await response.json();
+        statsEtag = response.ok ? response.headers.get('ETag') : null;
+
+        dom.totalEvents.textContent = stats.total_events || 0;
+        dom.successRate.textContent = Math.round(stats.success_rate || 0) + '%';
+        dom.authEvents.textContent = stats.events_by_type?.authentication || 0;
+        dom.apiEvents.textContent = stats.events_by_type?.api_access || 0;
+    } catch (error) {
+        console.error('Error loading audit stats:', error);
+    }
+}
+
+// Single flight: a call for the query already in flight is dropped, a call for a new
+// query aborts the old request so a slow stale response can never land last
+let logsCtrl = null;
+let logsQuery = null;
+
+async function loadAuditLogs() {
+    if (deferWhileHidden(loadAuditLogs)) {
+        return;
+    }
+    logParams.set('offset', String((currentPage - 1) * PAGE_SIZE));
+    const query = logParams.toString();
+    if (logsCtrl && logsQuery === query) {
+        return;
+    }
+    if (logsCtrl) {
+        logsCtrl.abort();
+    }
+    const ctrl = logsCtrl = new AbortController();
+    logsQuery = query;
+
+    try {
+        const response = await fetch(`/api/v1/audit-logs?${query}`, {
+            signal: ctrl.signal,
+            headers: conditionalHeaders(query === shownQuery ? shownEtag : null)
+        });
+        if (response.status === 304) {
+            return;
+        }
+        const data = await response.json();
+        shownQuery = query;
+        shownEtag = response.ok ? response.headers.get('ETag') : null;
+
+        // Rows and pagination change together: write both in one animation frame
+        requestAnimationFrame(() => {
+            displayLogs(data.logs || []);
+            updatePagination(data.total || 0);
+        });
+    } catch (error) {
+        if (error.name === 'AbortError') {
+            return;
+        }
+        console.error('Error loading audit logs:', error);
+        shownQuery = shownEtag = null;
+        dom.logsContainer.innerHTML =
+            '<div class="no-logs">Error loading audit logs. Please try again.</div>';
+    } finally {
+        if (logsCtrl === ctrl) {
+            logsCtrl = null;
+            logsQuery = null;
+        }
+    }
+}
+
+// Log rows are recycled: the first page clones one .log-entry per row from the page's
+// <template> and later pages only rebind their text, so paging never reparses HTML
+const logRows = [];
+
+function createLogRow() {
+    const entry = dom.logRowTemplate.content.firstElementChild.cloneNode(true);
+    const values = entry.querySelectorAll('.log-detail-value');
+    const extra = entry.querySelector('.log-detail-extra');
+    return {
+        entry,
+        timestamp: entry.querySelector('.log-timestamp'),
+        type: entry.querySelector('.log-type'),
+        values: Array.from(values).slice(0, 4),
+        extra,
+        extraValue: extra.querySelector('.log-detail-value'),
+        className: '',
+        key: null
+    };
+}
+
+// Bounded memo: the oldest entry is dropped once the cache holds LOG_MEMO_SIZE values
+const LOG_MEMO_SIZE = 1024;
+
+function memoized(cache, key, compute) {
+    let value = cache.get(key);
+    if (value === undefined) {
+        value = compute();
+        if (cache.size >= LOG_MEMO_SIZE) {
+            cache.delete(cache.keys().next().value);
+        }
+        cache.set(key, value);
+    }
+    return value;
+}
+
+// One shared formatter (toLocaleString() builds a new one per call); audit feeds repeat
+// timestamps, so formatted strings are memoized too
+const LOG_DATE_FORMAT = new Intl.DateTimeFormat(undefined, {dateStyle: 'short', timeStyle: 'medium'});
+const logDateCache = new Map();
+
+function formatLogDate(timestamp) {
+    return memoized(logDateCache, timestamp, () => LOG_DATE_FORMAT.format(new Date(timestamp)));
+}
+
+// Audit entries carry no id; their microsecond timestamp plus the other fields is one.
+// Refreshing or paging back re-fetches new objects, so a WeakMap on log.details would
+// never hit: pretty-printed details are memoized by this key instead.
+const logDetailsCache = new Map();
+
+function logKey(log) {
+    return `${log.timestamp}|${log.event_type}|${log.user}|${log.action}|${log.ip_address}|${log.success}`;
+}
+
+function bindLogRow(row, log) {
+    const key = logKey(log);
+    if (row.key === key) {
+        return;  // the row already shows this entry
+    }
+    row.key = key;
+
+    const className = `log-entry log-entry-${log.success ? 'success' : 'error'}`;
+    if (row.className !== className) {
+        row.entry.className = row.className = className;
+    }
+    row.timestamp.textContent = formatLogDate(log.timestamp);
+    row.type.textContent = log.event_type || 'system';
+    row.values[0].textContent = log.user || 'system';
+    row.values[1].textContent = log.action || 'Unknown';
+    row.values[2].textContent = log.ip_address || 'Unknown';
+    row.values[3].textContent = log.success ? 'Success' : 'Failed';
+    if (log.details) {
+        row.extraValue.textContent = memoized(logDetailsCache, key, () => JSON.stringify(log.details, null, 2));
+        row.extra.style.display = '';
+    } else {
+        row.extra.style.display = 'none';
+    }
+}
+
+function displayLogs(logs) {
+    const container = dom.logsContainer;
+
+    if (logs.length === 0) {
+        container.innerHTML = '<div class="no-logs">No audit logs found.</div>';
+        return;
+    }
+
+    while (logRows.length < logs.length) {
+        logRows.push(createLogRow());
+    }
+    logs.forEach((log, i) => bindLogRow(logRows[i], log));
+
+    // Only re-attach rows when the page size changed or a message replaced them
+    const entries = logRows.slice(0, logs.length).map(row => row.entry);
+    if (container.childElementCount !== entries.length || container.firstElementChild !== entries[0]) {
+        container.replaceChildren(...entries);
+    }
+}
+
+function updatePagination(total) {
+    totalPages = Math.ceil(total / PAGE_SIZE);
+
+    if (totalPages <= 1) {
+        dom.pagination.style.display = 'none';
+        return;
+    }
+
+    dom.pagination.style.display = 'flex';
+    dom.pageInfo.textContent = `Page ${currentPage} of ${totalPages}`;
+    dom.prevBtn.disabled = currentPage <= 1;
+    dom.nextBtn.disabled = currentPage >= totalPages;
+}
+
+function changePage(direction) {
+    const newPage = currentPage + direction;
+    if (newPage >= 1 && newPage <= totalPages) {
+        currentPage = newPage;
+        loadAuditLogs();
+    }
+}
+
+function applyFilters() {
+    // Only non-empty filters become query parameters
+    for (const [param, input] of Object.entries(FILTER_INPUTS)) {
+        if (input.value) {
+            logParams.set(param, input.value);
+        } else {
+            logParams.delete(param);
+        }
+    }
+
+    currentPage = 1;
+    loadAuditLogs();
+}
+
+function clearFilters() {
+    for (const [param, input] of Object.entries(FILTER_INPUTS)) {
+        input.value = '';
+        logParams.delete(param);
+    }
+    currentPage = 1;
+    loadAuditLogs();
+}
+
+function refreshLogs() {
+    loadAuditStats();
+    loadAuditLogs();
+}
+
+const ACTIONS = {
+    'toggle-theme': toggleTheme,
+    'logout': logout,
+    'apply-filters': applyFilters,
+    'clear-filters': clearFilters,
+    'refresh': refreshLogs,
+    'prev-page': () => changePage(-1),
+    'next-page': () => changePage(1)
+};
+
+// One delegated listener for every control on the page
+document.addEventListener('click', function(e) {
+    if (!(e.target instanceof Element)) {
+        return;
+    }
+    const actionEl = e.target.closest('[data-action]');
+    if (actionEl && ACTIONS[actionEl.dataset.action]) {
+        ACTIONS[actionEl.dataset.action]();
+    }
+});
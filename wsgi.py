@@ -0,0 +1,33 @@
+"""
+WSGI entry point for Mirror Test.
+
+Run behind gunicorn with gevent workers, e.g.:
+
+    gunicorn -k gevent -w 2 --worker-connections 500 wsgi:app
+
+Set MIRROR_TEST_CONFIG to use a configuration file other than the default.
+"""
+
+import os
+
+from web import create_app
+
+app = create_app(os.environ.get('MIRROR_TEST_CONFIG'))
+
+# python-ldap is a C extension that gevent cannot monkey-patch, so a bind
+# would stall every greenlet in the worker. Run it on the hub's threadpool.
+try:
+    from gevent import get_hub
+    from gevent.monkey import is_module_patched
+    GEVENT_PATCHED = is_module_patched('socket')
+except ImportError:
+    GEVENT_PATCHED = False
+
+if GEVENT_PATCHED:
+    _security_manager = app.extensions['mirror_test'].security_manager
+    _authenticate_ldaps = _security_manager.authenticate_ldaps
+
+    def _authenticate_ldaps_in_threadpool(username, password):
+        return get_hub().threadpool.apply(_authenticate_ldaps, (username, password))
+
+    _security_manager.authenticate_ldaps = _authenticate_ldaps_in_threadpool